@@ -1,7 +1,7 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os
-from conan.tools.build import check_min_cppstd
+from conan.tools.build import check_min_cppstd, valid_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import export_conandata_patches, apply_conandata_patches, copy, get, load, rmdir, save
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime
@@ -25,10 +25,36 @@ class AbseilConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "use_std_any": ["auto", True, False],
+        "use_std_optional": ["auto", True, False],
+        "use_std_variant": ["auto", True, False],
+        "use_std_string_view": ["auto", True, False],
+        "use_std_ordering": ["auto", True, False],
+        "hardened": [True, False],
+        "with_isa_extensions": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "use_std_any": "auto",
+        "use_std_optional": "auto",
+        "use_std_variant": "auto",
+        "use_std_string_view": "auto",
+        "use_std_ordering": "auto",
+        "hardened": False,
+        "with_isa_extensions": False,
+    }
+    options_description = {
+        "use_std_any": "Value of ABSL_OPTION_USE_STD_ANY: alias absl::any to std::any (True), "
+                       "use abseil's implementation (False) or decide based on the C++ standard (auto)",
+        "use_std_optional": "Value of ABSL_OPTION_USE_STD_OPTIONAL, see use_std_any",
+        "use_std_variant": "Value of ABSL_OPTION_USE_STD_VARIANT, see use_std_any",
+        "use_std_string_view": "Value of ABSL_OPTION_USE_STD_STRING_VIEW, see use_std_any",
+        "use_std_ordering": "Value of ABSL_OPTION_USE_STD_ORDERING, see use_std_any",
+        "hardened": "Value of ABSL_OPTION_HARDENED: enable runtime bounds checks in containers",
+        "with_isa_extensions": "Build with the ISA extensions used by the accelerated CRC32C and hashing paths "
+                               "(SSE4.2/PCLMUL/AES on x86, CRC/crypto on armv8), also applied to consumers. "
+                               "The resulting binaries require a CPU supporting them",
     }
     short_paths = True
     extension_properties = {"compatibility_cppstd": False}
@@ -36,9 +62,52 @@ class AbseilConan(ConanFile):
     def export_sources(self):
         export_conandata_patches(self)
 
+    @property
+    def _std_options(self):
+        # option name: macro in absl/base/options.h
+        return {
+            "use_std_any": "ABSL_OPTION_USE_STD_ANY",
+            "use_std_optional": "ABSL_OPTION_USE_STD_OPTIONAL",
+            "use_std_variant": "ABSL_OPTION_USE_STD_VARIANT",
+            "use_std_string_view": "ABSL_OPTION_USE_STD_STRING_VIEW",
+            "use_std_ordering": "ABSL_OPTION_USE_STD_ORDERING",
+        }
+
+    @property
+    def _std_options_min_cppstd(self):
+        return {
+            "use_std_any": 17,
+            "use_std_optional": 17,
+            "use_std_variant": 17,
+            "use_std_string_view": 17,
+            "use_std_ordering": 20,
+        }
+
+    @property
+    def _isa_extensions_flags(self):
+        # Not offered for MSVC: it has no switch enabling only these extensions, the closest
+        # being /arch:AVX which would require a much newer CPU than SSE4.2
+        if is_msvc(self):
+            return []
+        if self.settings.arch in ["x86", "x86_64"]:
+            return ["-msse4.2", "-mpclmul", "-maes"]
+        if str(self.settings.arch).startswith("armv8"):
+            return ["-march=armv8-a+crc+crypto"]
+        return []
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) >= "20250512.1":
+            # C++17 is required, these are always aliases of the std types
+            del self.options.use_std_any
+            del self.options.use_std_optional
+            del self.options.use_std_variant
+            del self.options.use_std_string_view
+        if Version(self.version) < "20230802.1":
+            del self.options.use_std_ordering
+        if not self._isa_extensions_flags:
+            del self.options.with_isa_extensions
 
     def configure(self):
         if self.options.shared:
@@ -48,6 +117,11 @@ class AbseilConan(ConanFile):
         minimum_cppstd = 17 if self.version >= Version("20250512.1") else 14
         check_min_cppstd(self, minimum_cppstd)
 
+        for option, cppstd in self._std_options_min_cppstd.items():
+            if self.options.get_safe(option) == True and not valid_min_cppstd(self, cppstd):
+                raise ConanInvalidConfiguration(f"{self.ref} {option}=True requires at least C++{cppstd}, "
+                                                "use 'auto' or False with older standards")
+
         if self.options.shared and is_msvc(self) and Version(self.version) < "20230802.1":
             # upstream tries its best to export symbols, but it's broken for the moment
             raise ConanInvalidConfiguration(f"{self.ref} shared not availabe for Visual Studio, please use version 20230802.1 or newer")
@@ -72,9 +146,27 @@ class AbseilConan(ConanFile):
         if self.settings.os == "Windows" and self.settings.compiler in ["msvc", "clang"] and self.settings.get_safe("compiler.runtime"):
             runtime = str(self.settings.compiler.runtime)
             tc.cache_variables["ABSL_MSVC_STATIC_RUNTIME"] = runtime == "static"
+        if self.options.get_safe("with_isa_extensions"):
+            tc.extra_cflags = self._isa_extensions_flags
+            tc.extra_cxxflags = self._isa_extensions_flags
         tc.generate()
 
+    def _patch_options_header(self):
+        # These are not CMake options, abseil expects them to be edited in options.h, which is
+        # installed with the resulting values so that consumers see the same configuration
+        options_h = os.path.join(self.source_folder, "absl", "base", "options.h")
+        content = load(self, options_h)
+        values = {macro: {"auto": "2", "True": "1", "False": "0"}[str(self.options.get_safe(option))]
+                  for option, macro in self._std_options.items() if option in self.options}
+        values["ABSL_OPTION_HARDENED"] = "1" if self.options.hardened else "0"
+        for macro, value in values.items():
+            content, count = re.subn(rf"^(#define {macro}) \d", rf"\g<1> {value}", content, flags=re.MULTILINE)
+            if count != 1:
+                raise ConanException(f"Could not find {macro} in {options_h}")
+        save(self, options_h, content)
+
     def build(self):
+        self._patch_options_header()
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
@@ -174,3 +266,7 @@ class AbseilConan(ConanFile):
             self.cpp_info.components[pkgconfig_name].system_libs = values.get("system_libs", [])
             self.cpp_info.components[pkgconfig_name].frameworks = values.get("frameworks", [])
             self.cpp_info.components[pkgconfig_name].requires = values.get("requires", [])
+            if self.options.get_safe("with_isa_extensions"):
+                # The inline code of the headers is selected with the same macros
+                self.cpp_info.components[pkgconfig_name].cflags = self._isa_extensions_flags
+                self.cpp_info.components[pkgconfig_name].cxxflags = self._isa_extensions_flags
@@ -97,6 +97,9 @@ class BoostConan(ConanFile):
         "lzma": [True, False],
         "zstd": [True, False],
         "segmented_stacks": [True, False],
+        "context_impl": [None, "fcontext", "ucontext", "winfib"],
+        "asio_io_uring": [True, False],
+        "asio_disable_epoll": [True, False],
         "debug_level": list(range(0, 14)),
         "pch": [True, False],
         "extra_b2_flags": [None, "ANY"],  # custom b2 flags
@@ -136,6 +139,9 @@ class BoostConan(ConanFile):
         "lzma": False,
         "zstd": False,
         "segmented_stacks": False,
+        "context_impl": None,
+        "asio_io_uring": False,
+        "asio_disable_epoll": False,
         "debug_level": 0,
         "pch": True,
         "extra_b2_flags": None,
@@ -151,6 +157,13 @@ class BoostConan(ConanFile):
     }
     default_options.update({f"without_{_name}": False for _name in CONFIGURE_OPTIONS})
     default_options.update({f"without_{_name}": True for _name in ("graph_parallel", "mpi", "python")})
+    options_description = {
+        "context_impl": "Boost.Context backend: fcontext (assembly, fastest), ucontext or winfib (Windows fibers). "
+                        "None uses the upstream default (fcontext)",
+        "asio_io_uring": "Define BOOST_ASIO_HAS_IO_URING and link liburing, to use io_uring for Asio file operations "
+                         "(and sockets too with asio_disable_epoll)",
+        "asio_disable_epoll": "Define BOOST_ASIO_DISABLE_EPOLL, so Asio uses io_uring (if enabled) or select as reactor",
+    }
 
     short_paths = True
     no_copy_source = True
@@ -414,6 +427,10 @@ class BoostConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.with_stacktrace_backtrace
 
+        if self.settings.os not in ["Linux", "Android"]:
+            del self.options.asio_io_uring
+            del self.options.asio_disable_epoll
+
         # nowide requires a c++11-able compiler + movable std::fstream: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         # json requires a c++11-able compiler: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         if self.settings.compiler.get_safe("cppstd"):
@@ -683,6 +700,9 @@ class BoostConan(ConanFile):
         if self.options.without_fiber:
             self.options.rm_safe("numa")
 
+        if self.options.without_context:
+            self.options.rm_safe("context_impl")
+
         # Use verbosity from [conf] if specified
         verbosity = self.conf.get("tools.build:verbosity", default="quiet")
         if verbosity == "verbose" and int(self.options.debug_level) < 2:
@@ -745,6 +765,14 @@ class BoostConan(ConanFile):
         if is_msvc(self) and self._shared and is_msvc_static_runtime(self):
             raise ConanInvalidConfiguration("Boost can not be built as shared library with MT runtime.")
 
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl == "winfib" and not self._is_windows_platform:
+            raise ConanInvalidConfiguration("context_impl=winfib is only available on Windows")
+        if context_impl == "ucontext" and self._is_windows_platform:
+            raise ConanInvalidConfiguration("context_impl=ucontext is not available on Windows")
+        if self.options.segmented_stacks and context_impl and context_impl != "ucontext":
+            raise ConanInvalidConfiguration("segmented_stacks requires context_impl=ucontext")
+
         # FIXME: In 1.84.0, there are compilation errors on msvc shared build for boost.fiber. https://github.com/boostorg/fiber/issues/314
         if Version(self.version) >= "1.84.0" and is_msvc(self) and self._shared and not self.options.without_fiber:
             raise ConanInvalidConfiguration("Boost.fiber can not be built as shared library on MSVC.")
@@ -840,6 +868,9 @@ class BoostConan(ConanFile):
             self.requires("zstd/[>=1.5 <1.6]")
         if self._with_stacktrace_backtrace:
             self.requires("libbacktrace/cci.20210118", transitive_headers=True, transitive_libs=True)
+        if self.options.get_safe("asio_io_uring"):
+            # Asio is header-only, consumers include and link liburing
+            self.requires("liburing/[>=2.4 <3]", transitive_headers=True, transitive_libs=True)
 
         if self._with_icu:
             self.requires("icu/74.2")
@@ -1406,6 +1437,20 @@ class BoostConan(ConanFile):
             flags.extend(["segmented-stacks=on",
                           "define=BOOST_USE_SEGMENTED_STACKS=1",
                           "define=BOOST_USE_UCONTEXT=1"])
+        if self.options.get_safe("context_impl"):
+            # https://www.boost.org/doc/libs/release/libs/context/doc/html/context/requirements.html
+            flags.append(f"context-impl={self.options.context_impl}")
+            if self.options.context_impl == "ucontext" and not self.options.segmented_stacks:
+                flags.append("define=BOOST_USE_UCONTEXT=1")
+            elif self.options.context_impl == "winfib":
+                flags.append("define=BOOST_USE_WINFIB=1")
+        if self.options.get_safe("asio_io_uring"):
+            # Compiled libraries using Asio (cobalt, process, ...) must agree with consumers on the backend
+            flags.append("define=BOOST_ASIO_HAS_IO_URING=1")
+            for includedir in self.dependencies["liburing"].cpp_info.aggregated_components().includedirs:
+                flags.append(f"include={includedir}")
+        if self.options.get_safe("asio_disable_epoll"):
+            flags.append("define=BOOST_ASIO_DISABLE_EPOLL=1")
         flags.append("pch=on" if self.options.pch else "pch=off")
 
         if is_apple_os(self):
@@ -1443,6 +1488,11 @@ class BoostConan(ConanFile):
                     icu_ldflags = " ".join(f"-l{l}" for l in icu_system_libs)
                 link_flags.append(icu_ldflags)
 
+        if self.options.get_safe("asio_io_uring") and self._shared:
+            liburing_cpp_info = self.dependencies["liburing"].cpp_info.aggregated_components()
+            link_flags.extend(f"-L{libdir}" for libdir in liburing_cpp_info.libdirs)
+            link_flags.extend(f"-l{lib}" for lib in liburing_cpp_info.libs)
+
         link_flags = f'linkflags="{" ".join(link_flags)}"'
         flags.append(link_flags)
 
@@ -1800,6 +1850,18 @@ class BoostConan(ConanFile):
         if self.options.segmented_stacks:
             self.cpp_info.components["headers"].defines.extend(["BOOST_USE_SEGMENTED_STACKS", "BOOST_USE_UCONTEXT"])
 
+        if self.options.get_safe("context_impl") == "ucontext" and not self.options.segmented_stacks:
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_UCONTEXT")
+        elif self.options.get_safe("context_impl") == "winfib":
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_WINFIB")
+
+        if self.options.get_safe("asio_io_uring"):
+            self.cpp_info.components["headers"].defines.append("BOOST_ASIO_HAS_IO_URING")
+            self.cpp_info.components["headers"].requires.append("liburing::liburing")
+
+        if self.options.get_safe("asio_disable_epoll"):
+            self.cpp_info.components["headers"].defines.append("BOOST_ASIO_DISABLE_EPOLL")
+
         if self.options.system_use_utf8:
             self.cpp_info.components["headers"].defines.append("BOOST_SYSTEM_USE_UTF8")
 
@@ -21,18 +21,35 @@ class FaissConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "opt_level": ["generic", "avx2", "avx512", "avx512_spr", "sve"],
+        "c_api": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "opt_level": "generic",
+        "c_api": False,
     }
 
     implements = ["auto_shared_fpic"]
 
+    @property
+    def _opt_level_libs(self):
+        # Upstream always builds the generic "faiss" library, and installs the
+        # optimized variants alongside it depending on FAISS_OPT_LEVEL
+        return {
+            "generic": [],
+            "avx2": ["faiss_avx2"],
+            "avx512": ["faiss_avx2", "faiss_avx512"],
+            "avx512_spr": ["faiss_avx2", "faiss_avx512_spr"],
+            "sve": ["faiss_sve"],
+        }[str(self.options.opt_level)]
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
+        # openblas is the only BLAS/LAPACK provider packaged in Conan Center
         self.requires("openblas/[^0.3.27]")
         self.requires("gflags/2.2.2")
 
@@ -46,6 +63,14 @@ class FaissConan(ConanFile):
             raise ConanInvalidConfiguration("OpenMP support is required, which is not "
                                             "available in Apple Clang")
 
+        if not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration(f"{self.ref} requires LAPACK routines: set -o openblas/*:build_lapack=True")
+
+        if self.options.opt_level in ["avx2", "avx512", "avx512_spr"] and self.settings.arch != "x86_64":
+            raise ConanInvalidConfiguration(f"-o {self.ref}:opt_level={self.options.opt_level} is only supported on x86_64")
+        if self.options.opt_level == "sve" and self.settings.arch != "armv8":
+            raise ConanInvalidConfiguration(f"-o {self.ref}:opt_level=sve is only supported on armv8")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
         replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
@@ -56,6 +81,8 @@ class FaissConan(ConanFile):
         tc.cache_variables["FAISS_ENABLE_GPU"] = False
         tc.cache_variables["BUILD_TESTING"] = False
         tc.cache_variables["FAISS_ENABLE_PYTHON"] = False
+        tc.cache_variables["FAISS_ENABLE_C_API"] = bool(self.options.c_api)
+        tc.cache_variables["FAISS_OPT_LEVEL"] = str(self.options.opt_level)
         tc.cache_variables["CMAKE_TRY_COMPILE_CONFIGURATION"] = str(self.settings.build_type)
 
         tc.generate()
@@ -79,14 +106,24 @@ class FaissConan(ConanFile):
         rm(self, "*.pdb", self.package_folder, recursive=True)
 
     def package_info(self):
-        self.cpp_info.libs = ["faiss"]
-
         self.cpp_info.set_property("cmake_file_name", "faiss")
-        self.cpp_info.set_property("cmake_target_name", "faiss")
-
-        if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.system_libs = ["m", "dl"]
-
-        if not self.options.shared and self.settings.compiler in ("clang", "gcc"):
-            self.cpp_info.exelinkflags.append("-fopenmp")
-            self.cpp_info.sharedlinkflags.append("-fopenmp")
+        self.cpp_info.set_property("cmake_target_name", "faiss_all_do_not_use")
+
+        for lib in ["faiss"] + self._opt_level_libs:
+            component = self.cpp_info.components[lib]
+            component.set_property("cmake_target_name", lib)
+            component.libs = [lib]
+            component.requires = ["openblas::openblas", "gflags::gflags"]
+
+            if self.settings.os in ["Linux", "FreeBSD"]:
+                component.system_libs = ["m", "dl"]
+
+            if not self.options.shared and self.settings.compiler in ("clang", "gcc"):
+                component.exelinkflags.append("-fopenmp")
+                component.sharedlinkflags.append("-fopenmp")
+
+        if self.options.c_api:
+            faiss_c = self.cpp_info.components["faiss_c"]
+            faiss_c.set_property("cmake_target_name", "faiss_c")
+            faiss_c.libs = ["faiss_c"]
+            faiss_c.requires = ["faiss"]
@@ -0,0 +1,67 @@
+# Parts of the autotools build missing from upstream CMakeLists.txt, included
+# at the end of the FFTW project by the conan recipe for each precision.
+
+# Additional codelet sets, selected at runtime like the sse2/avx/avx2 ones
+foreach(simd_set IN LISTS CONAN_FFTW_EXTRA_SIMD)
+    string(TOUPPER "${simd_set}" simd_macro)
+    string(REPLACE "-" "_" simd_macro "${simd_macro}")
+    file(GLOB conan_simd_SOURCE
+         ${CMAKE_CURRENT_SOURCE_DIR}/dft/simd/${simd_set}/*.c
+         ${CMAKE_CURRENT_SOURCE_DIR}/rdft/simd/${simd_set}/*.c)
+    target_sources(${fftw3_lib} PRIVATE ${conan_simd_SOURCE})
+    if(CONAN_FFTW_SIMD_FLAGS_${simd_macro})
+        set_source_files_properties(${conan_simd_SOURCE} PROPERTIES
+                                    COMPILE_OPTIONS "${CONAN_FFTW_SIMD_FLAGS_${simd_macro}}")
+    endif()
+    target_compile_definitions(${fftw3_lib} PRIVATE HAVE_${simd_macro}=1)
+endforeach()
+
+if(CONAN_FFTW_MPI)
+    find_package(MPI REQUIRED)
+    file(GLOB conan_mpi_SOURCE ${CMAKE_CURRENT_SOURCE_DIR}/mpi/*.c)
+    list(REMOVE_ITEM conan_mpi_SOURCE
+         ${CMAKE_CURRENT_SOURCE_DIR}/mpi/mpi-bench.c
+         ${CMAKE_CURRENT_SOURCE_DIR}/mpi/testsched.c)
+    add_library(${fftw3_lib}_mpi ${conan_mpi_SOURCE})
+    target_include_directories(${fftw3_lib}_mpi PRIVATE
+                               ${CMAKE_CURRENT_SOURCE_DIR}
+                               ${CMAKE_CURRENT_SOURCE_DIR}/api
+                               ${CMAKE_CURRENT_SOURCE_DIR}/mpi
+                               ${CMAKE_CURRENT_BINARY_DIR})
+    target_link_libraries(${fftw3_lib}_mpi PUBLIC ${fftw3_lib} MPI::MPI_C)
+    install(TARGETS ${fftw3_lib}_mpi
+            RUNTIME DESTINATION bin
+            LIBRARY DESTINATION lib
+            ARCHIVE DESTINATION lib)
+    install(FILES mpi/fftw3-mpi.h DESTINATION include)
+endif()
+
+# fftw-wisdom, built like tools/Makefile.am does on top of the benchmark sources
+if(CONAN_FFTW_WISDOM_TOOL)
+    file(GLOB conan_libbench2_SOURCE ${CMAKE_CURRENT_SOURCE_DIR}/libbench2/*.c)
+    list(REMOVE_ITEM conan_libbench2_SOURCE
+         ${CMAKE_CURRENT_SOURCE_DIR}/libbench2/main.c
+         ${CMAKE_CURRENT_SOURCE_DIR}/libbench2/useropt.c)
+    add_executable(fftw${PREC_SUFFIX}-wisdom
+                   ${conan_libbench2_SOURCE}
+                   tests/bench.c
+                   tests/hook.c
+                   tests/fftw-bench.c
+                   tools/fftw-wisdom.c)
+    target_include_directories(fftw${PREC_SUFFIX}-wisdom PRIVATE
+                               ${CMAKE_CURRENT_SOURCE_DIR}
+                               ${CMAKE_CURRENT_SOURCE_DIR}/api
+                               ${CMAKE_CURRENT_SOURCE_DIR}/libbench2
+                               ${CMAKE_CURRENT_SOURCE_DIR}/tests
+                               ${CMAKE_CURRENT_BINARY_DIR})
+    if(ENABLE_THREADS AND NOT WITH_COMBINED_THREADS)
+        target_link_libraries(fftw${PREC_SUFFIX}-wisdom PRIVATE ${fftw3_lib}_threads)
+    elseif(ENABLE_OPENMP)
+        target_link_libraries(fftw${PREC_SUFFIX}-wisdom PRIVATE ${fftw3_lib}_omp)
+    endif()
+    target_link_libraries(fftw${PREC_SUFFIX}-wisdom PRIVATE ${fftw3_lib})
+    if(UNIX)
+        target_link_libraries(fftw${PREC_SUFFIX}-wisdom PRIVATE m)
+    endif()
+    install(TARGETS fftw${PREC_SUFFIX}-wisdom RUNTIME DESTINATION bin)
+endif()
@@ -1,7 +1,10 @@
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import can_run
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
+from conan.tools.env import Environment
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, mkdir, rmdir, save
+from conan.tools.microsoft import is_msvc
 import os
 
 required_conan_version = ">=1.54.0"
@@ -34,7 +37,19 @@ class FFTWConan(ConanFile):
         "openmp": [True, False],
         "threads": [True, False],
         "combinedthreads": [True, False],
-        "simd": ["sse", "sse2", "avx", "avx2", False],
+        "simd": ["sse", "sse2", "avx", "avx2", False, "deprecated"],
+        "simd_sse": [True, False],
+        "simd_sse2": [True, False],
+        "simd_avx": [True, False],
+        "simd_avx2": [True, False],
+        "simd_avx512": [True, False],
+        "simd_avx_128_fma": [True, False],
+        "simd_neon": [True, False],
+        "simd_generic128": [True, False],
+        "simd_generic256": [True, False],
+        "mpi": [True, False],
+        "build_wisdom_tool": [True, False],
+        "wisdom_sizes": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -47,15 +62,87 @@ class FFTWConan(ConanFile):
         "openmp": False,
         "threads": False,
         "combinedthreads": False,
-        "simd": False,
+        "simd": "deprecated",
+        "simd_sse": False,
+        "simd_sse2": False,
+        "simd_avx": False,
+        "simd_avx2": False,
+        "simd_avx512": False,
+        "simd_avx_128_fma": False,
+        "simd_neon": False,
+        "simd_generic128": False,
+        "simd_generic256": False,
+        "mpi": False,
+        "build_wisdom_tool": False,
+        "wisdom_sizes": None,
     }
 
+    @property
+    def _is_x86(self):
+        return str(self.settings.arch) in ["x86", "x86_64"]
+
+    @property
+    def _is_arm(self):
+        return str(self.settings.arch).startswith("arm")
+
+    @property
+    def _simd_sets(self):
+        # option -> (codelet set, precisions it has codelets for, upstream CMake variable)
+        return {
+            "simd_sse": ("sse", [SINGLE], "ENABLE_SSE"),
+            "simd_sse2": ("sse2", [SINGLE, DOUBLE], "ENABLE_SSE2"),
+            "simd_avx": ("avx", [SINGLE, DOUBLE], "ENABLE_AVX"),
+            # upstream CMake also builds the avx2 codelets with FMA
+            "simd_avx2": ("avx2", [SINGLE, DOUBLE], "ENABLE_AVX2"),
+            "simd_avx512": ("avx512", [SINGLE, DOUBLE], None),
+            "simd_avx_128_fma": ("avx-128-fma", [SINGLE, DOUBLE], None),
+            # double precision NEON codelets require AArch64
+            "simd_neon": ("neon", [SINGLE, DOUBLE] if str(self.settings.arch).startswith("armv8") else [SINGLE], None),
+            "simd_generic128": ("generic-simd128", [SINGLE, DOUBLE], None),
+            "simd_generic256": ("generic-simd256", [SINGLE, DOUBLE], None),
+        }
+
+    def _with_simd(self, option):
+        # The deprecated 'simd' option enables one of the x86 sets
+        return bool(self.options.get_safe(option)) or (option in self.options and option == f"simd_{self.options.simd}")
+
+    def _simd_flags(self, simd_set):
+        if is_msvc(self):
+            return {"avx512": "/arch:AVX512"}.get(simd_set)
+        return {
+            "avx512": "-mavx512f",
+            "avx-128-fma": "-mavx;-mfma4",
+            "neon": None if str(self.settings.arch).startswith("armv8") else "-mfpu=neon",
+        }.get(simd_set)
+
+    @property
+    def _with_extras(self):
+        return self.options.get_safe("mpi") or self.options.build_wisdom_tool or \
+            any(self._with_simd(option) and not cmake_variable
+                for option, (_, _, cmake_variable) in self._simd_sets.items())
+
     def export_sources(self):
         export_conandata_patches(self)
+        copy(self, "*", src=os.path.join(self.recipe_folder, "cmake"), dst=os.path.join(self.export_sources_folder, "cmake"))
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            del self.options.mpi
+        if not self._is_x86:
+            del self.options.simd_sse
+            del self.options.simd_sse2
+            del self.options.simd_avx
+            del self.options.simd_avx2
+            del self.options.simd_avx512
+            del self.options.simd_avx_128_fma
+        if not self._is_arm:
+            del self.options.simd_neon
+        if is_msvc(self):
+            # FMA4 and the generic codelets rely on GCC compatible compilers
+            self.options.rm_safe("simd_avx_128_fma")
+            del self.options.simd_generic128
+            del self.options.simd_generic256
 
     def configure(self):
         if self.options.shared:
@@ -66,6 +153,14 @@ class FFTWConan(ConanFile):
             del self.options.combinedthreads
         if self.options.precision != "deprecated":
             self.output.warning("precision options is deprecated! use dedicated options 'precision_single', 'precision_double', 'precision_longdouble' and 'precision_quad' instead")
+        if self.options.simd != "deprecated":
+            self.output.warning("simd option is deprecated! use dedicated options 'simd_sse', 'simd_sse2', 'simd_avx', 'simd_avx2'... instead, they can be combined")
+        if not self.options.build_wisdom_tool:
+            del self.options.wisdom_sizes
+
+    def requirements(self):
+        if self.options.get_safe("mpi"):
+            self.requires("openmpi/[>=4.1 <5]", transitive_headers=True)
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -76,6 +171,14 @@ class FFTWConan(ConanFile):
                 raise ConanInvalidConfiguration("Shared fftw with openmp can't be built on Windows")
             if self.options.threads and not self.options.combinedthreads:
                 raise ConanInvalidConfiguration("Shared fftw with threads and not combinedthreads can't be built on Windows")
+        if self.options.get_safe("mpi") and self.options.precision_quad:
+            raise ConanInvalidConfiguration("FFTW MPI interface doesn't support quad precision")
+        if self.options.get_safe("simd_neon") and not any(p in self._simd_sets["simd_neon"][1] for p in self._all_precisions):
+            raise ConanInvalidConfiguration(f"simd_neon=True requires precision_single=True on {self.settings.arch}")
+
+    def validate_build(self):
+        if self.options.get_safe("wisdom_sizes") and not can_run(self):
+            raise ConanInvalidConfiguration("wisdom_sizes requires running fftw-wisdom, it can't be used when cross-building")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -86,10 +189,6 @@ class FFTWConan(ConanFile):
         tc.variables["ENABLE_OPENMP"] = self.options.openmp
         tc.variables["ENABLE_THREADS"] = self.options.threads
         tc.variables["WITH_COMBINED_THREADS"] = self.options.get_safe("combinedthreads", False)
-        tc.variables["ENABLE_SSE"] = self.options.simd == "sse"
-        tc.variables["ENABLE_SSE2"] = self.options.simd == "sse2"
-        tc.variables["ENABLE_AVX"] = self.options.simd == "avx"
-        tc.variables["ENABLE_AVX2"] = self.options.simd == "avx2"
         tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
 
@@ -102,16 +201,48 @@ class FFTWConan(ConanFile):
             return "ON" if value else 'OFF'
 
         apply_conandata_patches(self)
+        if self._with_extras:
+            extras = os.path.join(self.source_folder, os.pardir, "cmake", "conan_fftw_extras.cmake").replace("\\", "/")
+            save(self, os.path.join(self.source_folder, "CMakeLists.txt"), f"\ninclude(\"{extras}\")\n", append=True)
         for current_precision in self._all_precisions:
             cmake = CMake(self)
             variables = {
                 "ENABLE_FLOAT": on_off(current_precision == SINGLE),
                 "ENABLE_LONG_DOUBLE": on_off(current_precision == LONGDOUBLE),
-                "ENABLE_QUAD_PRECISION": on_off(current_precision == QUAD)
+                "ENABLE_QUAD_PRECISION": on_off(current_precision == QUAD),
+                "CONAN_FFTW_MPI": on_off(self.options.get_safe("mpi")),
+                "CONAN_FFTW_WISDOM_TOOL": on_off(self.options.build_wisdom_tool),
             }
+            # SIMD codelets only exist for some precisions, fftw's configure rejects the others
+            extra_simd = []
+            for option, (simd_set, precisions, cmake_variable) in self._simd_sets.items():
+                enabled = self._with_simd(option) and current_precision in precisions
+                if cmake_variable:
+                    variables[cmake_variable] = on_off(enabled)
+                elif enabled:
+                    extra_simd.append(simd_set)
+                    flags = self._simd_flags(simd_set)
+                    if flags:
+                        variables[f"CONAN_FFTW_SIMD_FLAGS_{simd_set.upper().replace('-', '_')}"] = flags
+            variables["CONAN_FFTW_EXTRA_SIMD"] = ";".join(extra_simd)
             cmake.configure(variables=variables)
             cmake.build()
             cmake.install()
+            if self.options.get_safe("wisdom_sizes"):
+                self._generate_wisdom(current_precision)
+
+    def _generate_wisdom(self, precision):
+        # Same file names as the system wisdom fftw_import_system_wisdom() reads from /etc/fftw
+        prec_suffix = self._prec_suffix[precision]
+        wisdom_folder = os.path.join(self.package_folder, "res", "fftw")
+        mkdir(self, wisdom_folder)
+        sizes = " ".join(str(self.options.wisdom_sizes).replace(",", " ").split())
+        env = Environment()
+        env.prepend_path("PATH", os.path.join(self.package_folder, "bin"))
+        env.prepend_path("LD_LIBRARY_PATH", os.path.join(self.package_folder, "lib"))
+        env.prepend_path("DYLD_LIBRARY_PATH", os.path.join(self.package_folder, "lib"))
+        with env.vars(self).apply():
+            self.run(f"fftw{prec_suffix}-wisdom -n -o \"{os.path.join(wisdom_folder, 'wisdom' + prec_suffix)}\" {sizes}")
 
     def package(self):
         copy(self, "COPYRIGHT", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
@@ -153,9 +284,24 @@ class FFTWConan(ConanFile):
             component.names["cmake_find_package_multi"] = cmake_target_name
             component.set_property("cmake_target_name", f"{cmake_namespace}::{cmake_target_name}")
             component.set_property("pkg_config_name", pkgconfig_name)
+            if self.options.get_safe("wisdom_sizes"):
+                component.resdirs = ["res"]
+
+            if self.options.get_safe("mpi"):
+                mpi_component = self.cpp_info.components[f"{component_name}_mpi"]
+                mpi_component.libs = [lib_name + "_mpi"]
+                mpi_component.requires = [component_name, "openmpi::ompi-c"]
+                mpi_component.names["cmake_find_package"] = f"{cmake_target_name}_mpi"
+                mpi_component.names["cmake_find_package_multi"] = f"{cmake_target_name}_mpi"
+                mpi_component.set_property("cmake_target_name", f"{cmake_namespace}::{cmake_target_name}_mpi")
+                mpi_component.set_property("pkg_config_name", f"{pkgconfig_name}_mpi")
 
     def package_id(self):
         del self.info.options.precision
+        # Same binary as the dedicated option enabled by the deprecated 'simd' value
+        if f"simd_{self.info.options.simd}" in self.info.options:
+            setattr(self.info.options, f"simd_{self.info.options.simd}", True)
+        del self.info.options.simd
 
     @property
     def _prec_suffix(self):
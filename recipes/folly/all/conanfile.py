@@ -25,10 +25,24 @@ class FollyConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_liburing": [True, False],
+        "with_libaio": [True, False],
+        "with_jemalloc": [True, False],
+        "with_coroutines": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_liburing": True,
+        "with_libaio": True,
+        "with_jemalloc": False,
+        "with_coroutines": True,
+    }
+    options_description = {
+        "with_liburing": "Build the io_uring based backends (folly::IoUring, IoUringBackend for EventBase)",
+        "with_libaio": "Build the libaio based folly::AsyncIO",
+        "with_jemalloc": "Link jemalloc, so that fbvector, IOBuf and sized deallocations use its extended API",
+        "with_coroutines": "Enable folly::coro (C++20 coroutines)",
     }
 
     def export_sources(self):
@@ -37,6 +51,9 @@ class FollyConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+            del self.options.with_libaio
 
     def configure(self):
         if self.options.shared:
@@ -68,9 +85,12 @@ class FollyConan(ConanFile):
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.requires("libiberty/9.1.0")
             self.requires("libunwind/[>=1.8.0 <2]")
-            if self.settings.os == "Linux":
+            if self.options.get_safe("with_liburing"):
                 self.requires("liburing/[>=2.15 <3]")
+            if self.options.get_safe("with_libaio"):
                 self.requires("libaio/0.3.113")
+        if self.options.with_jemalloc:
+            self.requires("jemalloc/5.3.0")
         self.requires("fmt/[>=11.2.0 <12]", transitive_headers=True, transitive_libs=True)
 
     @property
@@ -96,6 +116,10 @@ class FollyConan(ConanFile):
             if boost.options.get_safe(f"without_{boost_comp}"):
                 raise ConanInvalidConfiguration(f"Required Boost component: {boost_comp}. Pass '-o boost/*:without_{boost_comp}=False'")
 
+        if self.options.with_jemalloc and self.dependencies["jemalloc"].options.prefix:
+            # folly calls the unprefixed mallocx/sdallocx/nallocx
+            raise ConanInvalidConfiguration(f"-o {self.ref}:with_jemalloc=True requires jemalloc without symbol prefix: -o 'jemalloc/*:prefix='")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=False)
         apply_conandata_patches(self)
@@ -135,11 +159,25 @@ class FollyConan(ConanFile):
 
         if not self.dependencies["boost"].options.header_only:
             tc.cache_variables["BOOST_LINK_STATIC"] = not self.dependencies["boost"].options.shared
+
+        # Optional dependencies are detected by folly-deps.cmake with find_package(),
+        # make sure they are not picked up from the system when disabled
+        if not self.options.get_safe("with_liburing"):
+            tc.cache_variables["CMAKE_DISABLE_FIND_PACKAGE_LibUring"] = True
+        if not self.options.get_safe("with_libaio"):
+            tc.cache_variables["CMAKE_DISABLE_FIND_PACKAGE_LibAIO"] = True
+        tc.cache_variables["FOLLY_USE_JEMALLOC"] = bool(self.options.with_jemalloc)
+        if self.options.with_jemalloc and self.settings.compiler in ["clang", "apple-clang"]:
+            # Only enabled by default since clang 19, required for sdallocx to be used on delete
+            tc.extra_cxxflags = ["-fsized-deallocation"]
+        if not self.options.with_coroutines:
+            tc.preprocessor_definitions["FOLLY_CFG_NO_COROUTINES"] = "1"
         tc.generate()
 
         deps = CMakeDeps(self)
         # CMake file names
         deps.set_property("gflags", "cmake_file_name", "Gflags")
+        deps.set_property("jemalloc", "cmake_file_name", "Jemalloc")
         deps.set_property("glog", "cmake_file_name", "Glog")
         deps.set_property("libdwarf", "cmake_file_name", "LibDwarf")
         deps.set_property("libevent", "cmake_file_name", "LibEvent")
@@ -156,6 +194,7 @@ class FollyConan(ConanFile):
         deps.set_property("fmt", "cmake_additional_variables_prefixes", ["FMT"])
         deps.set_property("gflags", "cmake_additional_variables_prefixes", ["GFLAGS"])
         deps.set_property("glog", "cmake_additional_variables_prefixes", ["GLOG"])
+        deps.set_property("jemalloc", "cmake_additional_variables_prefixes", ["JEMALLOC"])
         deps.set_property("libdwarf", "cmake_additional_variables_prefixes", ["LIBDWARF"])
         deps.set_property("libevent", "cmake_additional_variables_prefixes", ["LIBEVENT"])
         deps.set_property("libiberty", "cmake_additional_variables_prefixes", ["LIBIBERTY"])
@@ -211,8 +250,16 @@ class FollyConan(ConanFile):
             self.cpp_info.components["libfolly"].requires.append("libdwarf::libdwarf")
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["libfolly"].requires.extend(["libiberty::libiberty", "libunwind::libunwind"])
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["libfolly"].requires.append("liburing::liburing")
+        if self.options.get_safe("with_libaio"):
+            self.cpp_info.components["libfolly"].requires.append("libaio::libaio")
+        if self.options.with_jemalloc:
+            self.cpp_info.components["libfolly"].requires.append("jemalloc::jemalloc")
+            self.cpp_info.components["libfolly"].defines.append("FOLLY_USE_JEMALLOC=1")
+        if not self.options.with_coroutines:
+            self.cpp_info.components["libfolly"].defines.append("FOLLY_CFG_NO_COROUTINES=1")
         if self.settings.os == "Linux":
-            self.cpp_info.components["libfolly"].requires.extend(["liburing::liburing", "libaio::libaio"])
             self.cpp_info.components["libfolly"].system_libs.extend(["pthread", "dl", "rt"])
             self.cpp_info.components["libfolly"].defines.extend(["FOLLY_HAVE_ELF", "FOLLY_HAVE_DWARF"])
         elif self.settings.os == "Windows":
@@ -38,7 +38,8 @@ class GrpcConan(ConanFile):
         "ruby_plugin": [True, False],
         "otel_plugin": [True, False],
         "secure": [True, False],
-        "with_libsystemd": [True, False]
+        "with_libsystemd": [True, False],
+        "with_jemalloc": [True, False],
     }
     default_options = {
         "shared": False,
@@ -54,7 +55,11 @@ class GrpcConan(ConanFile):
         "ruby_plugin": True,
         "otel_plugin": False,
         "secure": False,
-        "with_libsystemd": False
+        "with_libsystemd": False,
+        "with_jemalloc": False,
+    }
+    options_description = {
+        "with_jemalloc": "Link jemalloc as the process allocator of gRPC consumers",
     }
 
     _target_info = None
@@ -125,6 +130,8 @@ class GrpcConan(ConanFile):
                 self.requires("libsystemd/255")
         if self.options.get_safe("otel_plugin"):
             self.requires("opentelemetry-cpp/1.14.2")
+        if self.options.with_jemalloc:
+            self.requires("jemalloc/5.3.0")
 
     def package_id(self):
         del self.info.options.secure
@@ -143,6 +150,10 @@ class GrpcConan(ConanFile):
                 "Please, use `protobuf:shared=True`.",
             )
 
+        if self.options.with_jemalloc and self.dependencies["jemalloc"].options.prefix:
+            # A prefixed jemalloc would not replace malloc
+            raise ConanInvalidConfiguration(f"-o {self.ref}:with_jemalloc=True requires jemalloc without symbol prefix: -o 'jemalloc/*:prefix='")
+
         abseil_cppstd = self.dependencies.host['abseil'].info.settings.compiler.cppstd
         if abseil_cppstd != self.settings.compiler.cppstd:
             raise ConanInvalidConfiguration(f"grpc and abseil must be built with the same compiler.cppstd setting")
@@ -327,9 +338,10 @@ class GrpcConan(ConanFile):
                 continue
             if not self.options.codegen and target['name'] in ["grpc++_reflection", "grpcpp_channelz"]:
                 continue
+            jemalloc = ["jemalloc::jemalloc"] if self.options.with_jemalloc and target['name'] == "gpr" else []
             components[target['name']] = {
                 "lib": target['lib'],
-                "requires": target.get('requires', []) + libsystemd,
+                "requires": target.get('requires', []) + libsystemd + jemalloc,
                 "system_libs": system_libs,
                 "frameworks": target.get('frameworks', []),
             }
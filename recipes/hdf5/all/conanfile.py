@@ -1,12 +1,13 @@
 import glob
 import os
+import re
 import textwrap
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import cross_building, check_min_cppstd, valid_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rm, rmdir, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, replace_in_file, rm, rmdir, save
 from conan.tools.scm import Version
 
 required_conan_version = ">=2.0"
@@ -33,6 +34,12 @@ class Hdf5Conan(ConanFile):
         "szip_encoding": [True, False],
         "parallel": [True, False],
         "enable_unsupported": [True, False],
+        "direct_vfd": [True, False],
+        "subfiling_vfd": [True, False],
+        "map_api": [True, False],
+        "chunk_cache_size": [None, "ANY"],
+        "chunk_cache_nslots": [None, "ANY"],
+        "with_zstd_plugin": [True, False],
     }
     default_options = {
         "shared": False,
@@ -45,15 +52,36 @@ class Hdf5Conan(ConanFile):
         "szip_support": None,
         "szip_encoding": False,
         "parallel": False,
-        "enable_unsupported": False
+        "enable_unsupported": False,
+        "direct_vfd": False,
+        "subfiling_vfd": False,
+        "map_api": False,
+        "chunk_cache_size": None,   # 1 MiB in the sources
+        "chunk_cache_nslots": None,  # 521 in the sources
+        "with_zstd_plugin": False,
+    }
+    options_description = {
+        "direct_vfd": "Build the direct VFD (H5Pset_fapl_direct), doing O_DIRECT I/O",
+        "subfiling_vfd": "Build the subfiling VFD (H5Pset_fapl_subfiling), requires parallel=True",
+        "map_api": "Build the H5M map API (H5_HAVE_MAP_API)",
+        "chunk_cache_size": "Default size in bytes of the raw data chunk cache of each dataset",
+        "chunk_cache_nslots": "Default number of slots of the raw data chunk cache, a prime number about 100 times "
+                              "the number of chunks fitting in chunk_cache_size is recommended",
+        "with_zstd_plugin": "Build the zstd filter plugin (filter id 32015, same format as H5Z-ZSTD) in lib/plugin, "
+                            "set as HDF5_PLUGIN_PATH",
     }
 
     def export_sources(self):
         export_conandata_patches(self)
+        copy(self, "*", src=os.path.join(self.recipe_folder, "plugins"), dst=os.path.join(self.export_sources_folder, "plugins"))
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            del self.options.subfiling_vfd
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            # O_DIRECT
+            del self.options.direct_vfd
 
     def configure(self):
         if self.options.shared:
@@ -66,6 +94,8 @@ class Hdf5Conan(ConanFile):
             del self.options.threadsafe
         if not bool(self.options.szip_support):
             del self.options.szip_encoding
+        if not self.options.parallel:
+            self.options.rm_safe("subfiling_vfd")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -81,6 +111,9 @@ class Hdf5Conan(ConanFile):
             self.requires("szip/2.1.1")
         if self.options.parallel:
             self.requires("openmpi/[>=4.1.0 <5]")
+        # Only linked into the plugins, which are not linked by consumers
+        if self.options.with_zstd_plugin:
+            self.requires("zstd/[>=1.5 <1.6]", visible=False)
 
     def validate(self):
         if self.options.parallel and not self.options.enable_unsupported:
@@ -98,6 +131,16 @@ class Hdf5Conan(ConanFile):
             raise ConanInvalidConfiguration("with_zlibng=True is incompatible with versions prior to v1.14.5")
         if self.options.enable_cxx:
             check_min_cppstd(self, "11")
+        for option in ["chunk_cache_size", "chunk_cache_nslots"]:
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"{option} must be a positive integer")
+        if self.options.with_zstd_plugin:
+            if not self.options.shared:
+                raise ConanInvalidConfiguration("with_zstd_plugin=True requires shared=True, plugins link the HDF5 shared library")
+            if self.dependencies["zstd"].options.shared:
+                # The plugins are loaded from HDF5_PLUGIN_PATH, they have to be self-contained
+                raise ConanInvalidConfiguration("with_zstd_plugin=True requires zstd/*:shared=False")
 
     def validate_build(self):
         if cross_building(self) and Version(self.version) < "1.14.4.3":
@@ -153,13 +196,36 @@ class Hdf5Conan(ConanFile):
         tc.variables["HDF5_BUILD_CPP_LIB"] = self.options.enable_cxx
         tc.variables["HDF5_BUILD_JAVA"] = False
         tc.variables["ALLOW_UNSUPPORTED"] = self.options.enable_unsupported
+        tc.variables["HDF5_ENABLE_DIRECT_VFD"] = self.options.get_safe("direct_vfd", False)
+        tc.variables["HDF5_ENABLE_SUBFILING_VFD"] = self.options.get_safe("subfiling_vfd", False)
+        tc.variables["HDF5_ENABLE_MAP_API"] = self.options.map_api
+        tc.variables["CONAN_HDF5_ZSTD_PLUGIN"] = self.options.with_zstd_plugin
         tc.generate()
 
+    def _patch_chunk_cache_defaults(self):
+        # Defaults of the file access property list, there are no configure options for them
+        h5pfapl = os.path.join(self.source_folder, "src", "H5Pfapl.c")
+        content = load(self, h5pfapl)
+        for option, macro in [("chunk_cache_size", "H5F_ACS_DATA_CACHE_BYTE_SIZE_DEF"),
+                              ("chunk_cache_nslots", "H5F_ACS_DATA_CACHE_NUM_SLOTS_DEF")]:
+            value = self.options.get_safe(option)
+            if not value:
+                continue
+            content, count = re.subn(rf"^(#define\s+{macro}\s+).*$", rf"\g<1>((size_t){value})", content, flags=re.MULTILINE)
+            if count != 1:
+                raise ConanException(f"Failed to set {macro} in {h5pfapl}")
+        save(self, h5pfapl, content)
+
     def build(self):
         apply_conandata_patches(self)
         # Do not force PIC
         replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
                 "set (CMAKE_POSITION_INDEPENDENT_CODE ON)", "")
+        self._patch_chunk_cache_defaults()
+        if self.options.with_zstd_plugin:
+            plugins_folder = os.path.join(self.source_folder, os.pardir, "plugins").replace("\\", "/")
+            save(self, os.path.join(self.source_folder, "CMakeLists.txt"),
+                 f"\nadd_subdirectory(\"{plugins_folder}\" \"${{CMAKE_BINARY_DIR}}/conan_plugins\")\n", append=True)
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
@@ -203,6 +269,8 @@ class Hdf5Conan(ConanFile):
 
     def _create_cmake_module_variables(self, module_file, is_parallel):
         content = "set(HDF5_IS_PARALLEL {})".format("ON" if is_parallel else "OFF")
+        if self.options.with_zstd_plugin:
+            content += '\nset(HDF5_PLUGIN_PATH "${CMAKE_CURRENT_LIST_DIR}/../plugin")'
         save(self, module_file, content)
 
     @property
@@ -290,6 +358,9 @@ class Hdf5Conan(ConanFile):
             if self.options.get_safe("enable_cxx"):
                 add_component("hdf5_hl_cpp", **components["hdf5_hl_cpp"])
 
+        if self.options.with_zstd_plugin:
+            self.runenv_info.define_path("HDF5_PLUGIN_PATH", os.path.join(self.package_folder, "lib", "plugin"))
+
         # TODO: to remove in conan v2 once cmake_find_package_* generators removed
         self.cpp_info.names["cmake_find_package"] = "HDF5"
         self.cpp_info.names["cmake_find_package_multi"] = "HDF5"
@@ -0,0 +1,67 @@
+/*
+ * Zstandard filter plugin, registered filter id 32015.
+ *
+ * Chunks are stored as a single zstd frame, as with the H5Z-ZSTD plugin of
+ * https://github.com/HDFGroup/hdf5_plugins, cd_values[0] is the optional
+ * compression level.
+ */
+#include <H5PLextern.h>
+#include <zstd.h>
+
+#define H5Z_FILTER_ZSTD 32015
+
+static size_t H5Z_filter_zstd(unsigned int flags, size_t cd_nelmts, const unsigned int cd_values[],
+                              size_t nbytes, size_t *buf_size, void **buf)
+{
+    void *outbuf = NULL;
+    size_t outbuf_size = 0;
+    size_t result = 0;
+
+    if (flags & H5Z_FLAG_REVERSE) {
+        unsigned long long content_size = ZSTD_getFrameContentSize(*buf, nbytes);
+        if (content_size == ZSTD_CONTENTSIZE_ERROR || content_size == ZSTD_CONTENTSIZE_UNKNOWN)
+            return 0;
+        outbuf_size = (size_t)content_size;
+        if (NULL == (outbuf = H5allocate_memory(outbuf_size, 0)))
+            return 0;
+        result = ZSTD_decompress(outbuf, outbuf_size, *buf, nbytes);
+    }
+    else {
+        int level = cd_nelmts > 0 ? (int)cd_values[0] : ZSTD_CLEVEL_DEFAULT;
+        outbuf_size = ZSTD_compressBound(nbytes);
+        if (NULL == (outbuf = H5allocate_memory(outbuf_size, 0)))
+            return 0;
+        result = ZSTD_compress(outbuf, outbuf_size, *buf, nbytes, level);
+    }
+
+    if (ZSTD_isError(result)) {
+        H5free_memory(outbuf);
+        return 0;
+    }
+
+    H5free_memory(*buf);
+    *buf = outbuf;
+    *buf_size = outbuf_size;
+    return result;
+}
+
+static const H5Z_class2_t H5Z_ZSTD[1] = {{
+    H5Z_CLASS_T_VERS,
+    (H5Z_filter_t)H5Z_FILTER_ZSTD,
+    1, /* encoder_present */
+    1, /* decoder_present */
+    "Zstandard compression: http://www.zstd.net",
+    NULL, /* can_apply */
+    NULL, /* set_local */
+    (H5Z_func_t)H5Z_filter_zstd,
+}};
+
+H5PL_type_t H5PLget_plugin_type(void)
+{
+    return H5PL_TYPE_FILTER;
+}
+
+const void *H5PLget_plugin_info(void)
+{
+    return H5Z_ZSTD;
+}
@@ -4,7 +4,7 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.env import VirtualBuildEnv
-from conan.tools.files import chdir, copy, get, replace_in_file
+from conan.tools.files import chdir, copy, get, replace_in_file, rm
 from conan.tools.gnu import Autotools, AutotoolsToolchain
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, NMakeToolchain
@@ -24,11 +24,46 @@ class LibisalConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_erasure_code": [True, False],
+        "with_crc": [True, False],
+        "with_igzip": [True, False],
+        "with_raid": [True, False],
+        "with_mem": [True, False],
+        "build_programs": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_erasure_code": True,
+        "with_crc": True,
+        "with_igzip": True,
+        "with_raid": True,
+        "with_mem": True,
+        "build_programs": False,
     }
+    options_description = {
+        "with_erasure_code": "Build the erasure code (Reed-Solomon) functions",
+        "with_crc": "Build the CRC functions",
+        "with_igzip": "Build the igzip deflate/inflate functions, requires with_crc",
+        "with_raid": "Build the RAID (XOR/P+Q parity) functions",
+        "with_mem": "Build the memory routines (zero detection)",
+        "build_programs": "Build the igzip command line program, requires with_igzip",
+    }
+
+    @property
+    def _modules(self):
+        # module: public headers
+        return {
+            "erasure_code": ["erasure_code.h", "gf_vect_mul.h"],
+            "crc": ["crc.h", "crc64.h"],
+            "igzip": ["igzip_lib.h"],
+            "raid": ["raid.h"],
+            "mem": ["mem_routines.h"],
+        }
+
+    @property
+    def _enabled_modules(self):
+        return [module for module in self._modules if self.options.get_safe(f"with_{module}")]
 
     @property
     def _settings_build(self):
@@ -52,6 +87,16 @@ class LibisalConan(ConanFile):
             raise ConanInvalidConfiguration(f"{self.settings.arch} architecture is not supported")
         if self.version == "2.30.0" and self._settings_build.arch == "armv8":
             raise ConanInvalidConfiguration(f"Version {self.version} does not support armv8")
+        if not self._enabled_modules:
+            raise ConanInvalidConfiguration(f"At least one of the {self.ref} modules must be enabled")
+        if self.options.with_igzip and not self.options.with_crc:
+            raise ConanInvalidConfiguration(f"-o {self.ref}:with_igzip=True requires -o {self.ref}:with_crc=True")
+        if self.options.build_programs and not self.options.with_igzip:
+            raise ConanInvalidConfiguration(f"-o {self.ref}:build_programs=True requires -o {self.ref}:with_igzip=True")
+        if is_msvc(self) and len(self._enabled_modules) != len(self._modules):
+            raise ConanInvalidConfiguration(f"{self.ref} modules can't be disabled with msvc, the nmake build always includes all of them")
+        if is_msvc(self) and self.options.build_programs:
+            raise ConanInvalidConfiguration(f"-o {self.ref}:build_programs=True is not supported with msvc")
 
     def build_requirements(self):
         self.tool_requires("nasm/2.15.05")
@@ -78,7 +123,21 @@ class LibisalConan(ConanFile):
             env.define("AS", "nasm")
             tc.generate(env)
 
+    def _patch_sources(self):
+        makefile_am = os.path.join(self.source_folder, "Makefile.am")
+        for module in self._modules:
+            if module not in self._enabled_modules:
+                replace_in_file(self, makefile_am, f"include {module}/Makefile.am", "")
+        if not self.options.with_erasure_code:
+            replace_in_file(self, makefile_am, "include examples/ec/Makefile.am", "")
+        if not self.options.with_igzip:
+            # The igzip program and the fuzz tests are built on top of igzip
+            replace_in_file(self, makefile_am, "include programs/Makefile.am", "")
+            replace_in_file(self, makefile_am, "include tests/fuzz/Makefile.am", "")
+
     def build(self):
+        if not is_msvc(self):
+            self._patch_sources()
         with chdir(self, self.source_folder):
             if is_msvc(self):
                 replace_in_file(self, "Makefile.nmake",
@@ -102,6 +161,10 @@ class LibisalConan(ConanFile):
              dst=os.path.join(self.package_folder, "include/isa-l"),
              src=os.path.join(self.source_folder, "include"),
              keep_path=False)
+        for module, headers in self._modules.items():
+            if module not in self._enabled_modules:
+                for header in headers:
+                    rm(self, header, os.path.join(self.package_folder, "include", "isa-l"))
         copy(self, "*.dll",
              dst=os.path.join(self.package_folder, "bin"),
              src=self.source_folder,
@@ -111,12 +174,29 @@ class LibisalConan(ConanFile):
                  dst=os.path.join(self.package_folder, "lib"),
                  src=self.source_folder,
                  keep_path=False)
+        if self.options.build_programs:
+            # With a shared build, programs/igzip is a libtool wrapper script
+            programs_folder = os.path.join(self.source_folder, "programs")
+            if self.options.shared and not is_msvc(self):
+                programs_folder = os.path.join(programs_folder, ".libs")
+            for program in ["igzip", "igzip.exe"]:
+                copy(self, program,
+                     dst=os.path.join(self.package_folder, "bin"),
+                     src=programs_folder,
+                     keep_path=False)
         fix_apple_shared_install_name(self)
 
     def package_info(self):
         self.cpp_info.set_property("pkg_config_name", "libisal")
+
+        # Upstream always builds a single library, each module is published as its own
+        # component so that consumers can express which ones they depend on
+        self.cpp_info.components["libisal"].set_property("pkg_config_name", "libisal")
         if is_msvc(self):
             suffix = "" if self.options.shared else "_static"
-            self.cpp_info.libs = [f"isa-l{suffix}"]
+            self.cpp_info.components["libisal"].libs = [f"isa-l{suffix}"]
         else:
-            self.cpp_info.libs = ["isal"]
+            self.cpp_info.components["libisal"].libs = ["isal"]
+        for module in self._enabled_modules:
+            self.cpp_info.components[module].set_property("cmake_target_name", f"isa-l::{module}")
+            self.cpp_info.components[module].requires = ["libisal"]
@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
@@ -22,13 +23,35 @@ class LibaomAv1Conan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "assembly": [True, False],
+        "sse4_1": [True, False],
+        "sse4_2": [True, False],
+        "avx": [True, False],
+        "avx2": [True, False],
+        "neon": [True, False],
+        "runtime_cpu_detect": [True, False],
+        "encoder": [True, False],
+        "decoder": [True, False],
+        "realtime_only": [True, False],
+        "multithread": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "assembly": False,
+        "sse4_1": True,
+        "sse4_2": True,
+        "avx": True,
+        "avx2": True,
+        "neon": True,
+        "runtime_cpu_detect": True,
+        "encoder": True,
+        "decoder": True,
+        "realtime_only": False,
+        "multithread": True,
     }
 
+    _x86_isa_options = ("sse4_1", "sse4_2", "avx", "avx2")
+
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
@@ -41,13 +64,32 @@ class LibaomAv1Conan(ConanFile):
             del self.options.fPIC
         if self.settings.arch not in ("x86", "x86_64"):
             del self.options.assembly
+            for name in self._x86_isa_options:
+                delattr(self.options, name)
+        if self.settings.arch != "armv8":
+            del self.options.neon
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if not self.options.get_safe("assembly", True):
+            for name in self._x86_isa_options:
+                self.options.rm_safe(name)
+        if not self._with_simd:
+            self.options.rm_safe("runtime_cpu_detect")
+        if not self.options.encoder:
+            self.options.rm_safe("realtime_only")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
 
+    @property
+    def _with_simd(self):
+        return self.options.get_safe("assembly", False) or self.options.get_safe("neon", False)
+
+    def validate(self):
+        if not self.options.encoder and not self.options.decoder:
+            raise ConanInvalidConfiguration("At least one of encoder or decoder must be enabled")
+
     def build_requirements(self):
         if self.options.get_safe("assembly", False):
             self.tool_requires("nasm/[*]")
@@ -68,9 +110,21 @@ class LibaomAv1Conan(ConanFile):
         tc.variables["ENABLE_TESTS"] = False
         tc.variables["ENABLE_DOCS"] = False
         tc.variables["ENABLE_TOOLS"] = False
-        if not self.options.get_safe("assembly", False):
+        if not self._with_simd:
             # make non-assembly build
             tc.variables["AOM_TARGET_CPU"] = "generic"
+        else:
+            # required to be 1/0 instead of False
+            tc.variables["CONFIG_RUNTIME_CPU_DETECT"] = int(bool(self.options.runtime_cpu_detect))
+            for name in self._x86_isa_options:
+                if name in self.options:
+                    tc.variables[f"ENABLE_{name.upper()}"] = self.options.get_safe(name)
+            if "neon" in self.options:
+                tc.variables["ENABLE_NEON"] = self.options.neon
+        tc.variables["CONFIG_AV1_ENCODER"] = int(bool(self.options.encoder))
+        tc.variables["CONFIG_AV1_DECODER"] = int(bool(self.options.decoder))
+        tc.variables["CONFIG_REALTIME_ONLY"] = int(bool(self.options.get_safe("realtime_only", False)))
+        tc.variables["CONFIG_MULTITHREAD"] = int(bool(self.options.multithread))
         # libyuv is used for examples, tests and non-essential 'dump_obu' tool so it is disabled
         # required to be 1/0 instead of False
         tc.variables["CONFIG_LIBYUV"] = 0
@@ -8,6 +8,7 @@ from conan.tools.files import apply_conandata_patches, copy, download, export_co
 from conan.tools.gnu import Autotools, AutotoolsToolchain, PkgConfigDeps
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, unix_path
+from conan.tools.scm import Version
 
 import os
 import re
@@ -51,7 +52,9 @@ class LibcurlConan(ConanFile):
         "with_libgsasl": [True, False],
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
+        "max_write_size": [None, "ANY"],
         "with_nghttp2": [True, False],
+        "with_nghttp3": [True, False],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
@@ -99,7 +102,9 @@ class LibcurlConan(ConanFile):
         "with_libgsasl": False,
         "with_libpsl": False,
         "with_largemaxwritesize": False,
+        "max_write_size": None,
         "with_nghttp2": False,
+        "with_nghttp3": False,
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
@@ -173,6 +178,8 @@ class LibcurlConan(ConanFile):
             self.requires("openldap/[>=2.6 <3]")
         if self.options.with_nghttp2:
             self.requires("libnghttp2/[>=1.59.0 <2]")
+        if self.options.with_nghttp3:
+            self.requires("nghttp3/[>=1.1.0 <2]")
         if self.options.with_libssh2:
             self.requires("libssh2/[>=1.11.0 <2]")
         if self.options.with_zlib:
@@ -200,6 +207,21 @@ class LibcurlConan(ConanFile):
             raise ConanInvalidConfiguration("option with_ssl=wolfssl requires wolfssl/*:with_curl=True")
         if self.options.get_safe("with_apple_sectrust") and self.options.with_ssl != "openssl":
             raise ConanInvalidConfiguration("Apple SecTrust is only supported for OpenSSL/GnuTLS builds")
+        if self.options.with_nghttp3:
+            # HTTP/3 is provided by the OpenSSL QUIC stack, the only QUIC backend available in Conan Center
+            if self.options.with_ssl != "openssl":
+                raise ConanInvalidConfiguration("option with_nghttp3=True requires with_ssl=openssl")
+            if Version(self.dependencies["openssl"].ref.version) < "3.3.0":
+                raise ConanInvalidConfiguration("option with_nghttp3=True requires openssl >= 3.3.0")
+            if not self.options.with_http:
+                raise ConanInvalidConfiguration("option with_nghttp3=True requires with_http=True")
+        if self.options.max_write_size:
+            if self.options.with_largemaxwritesize:
+                raise ConanInvalidConfiguration("options with_largemaxwritesize and max_write_size can't be used together")
+            if not str(self.options.max_write_size).isdigit() or \
+                    not 16384 <= int(str(self.options.max_write_size)) <= 10485760:
+                # CURLOPT_BUFFERSIZE can't go beyond CURL_MAX_READ_SIZE (10MB)
+                raise ConanInvalidConfiguration("option max_write_size must be a number of bytes between 16384 and 10485760")
 
     def build_requirements(self):
         if self._is_using_cmake_build:
@@ -224,6 +246,7 @@ class LibcurlConan(ConanFile):
         cert_sha256 = self.conf.get("user.libcurl.cert:sha256", check_type=str) or "8ac40bdd3d3e151a6b4078d2b2029796e8f843e3f86fbf2adbc4dd9f05e79def"
         download(self, cert_url, "cacert.pem", verify=True, sha256=cert_sha256)
         replace_in_file(self, "CMakeLists.txt", "find_package(NGHTTP2 MODULE)", "find_package(NGHTTP2 CONFIG REQUIRED)")
+        replace_in_file(self, "CMakeLists.txt", "find_package(NGHTTP3 MODULE REQUIRED)", "find_package(NGHTTP3 CONFIG REQUIRED)", strict=False)
         replace_in_file(self, "CMakeLists.txt", "find_package(Cares MODULE REQUIRED)", "find_package(Cares CONFIG REQUIRED)")
         replace_in_file(self, os.path.join("CMake", "Macros.cmake"), "find_package(${_find_name})", "find_package(${_find_name} CONFIG REQUIRED)")
         replace_in_file(self, os.path.join("CMake", "Macros.cmake"), "find_package(${_find_name} MODULE)", "find_package(${_find_name} CONFIG REQUIRED)")
@@ -270,10 +293,11 @@ class LibcurlConan(ConanFile):
         self._patch_autotools()
 
     def _patch_misc_files(self):
-        if self.options.with_largemaxwritesize:
+        max_write_size = "10485760" if self.options.with_largemaxwritesize else self.options.max_write_size
+        if max_write_size:
             replace_in_file(self, os.path.join(self.source_folder, "include", "curl", "curl.h"),
                                   "define CURL_MAX_WRITE_SIZE 16384",
-                                  "define CURL_MAX_WRITE_SIZE 10485760")
+                                  f"define CURL_MAX_WRITE_SIZE {max_write_size}")
 
     def _patch_autotools(self):
         if self._is_using_cmake_build:
@@ -383,6 +407,12 @@ class LibcurlConan(ConanFile):
         else:
             tc.configure_args.append("--without-nghttp2")
 
+        if self.options.with_nghttp3:
+            path = unix_path(self, self.dependencies["nghttp3"].package_folder)
+            tc.configure_args.extend([f"--with-nghttp3={path}", "--with-openssl-quic"])
+        else:
+            tc.configure_args.extend(["--without-nghttp3", "--without-openssl-quic"])
+
         if self.options.with_zlib:
             tc.configure_args.append("--with-zlib")
         else:
@@ -516,6 +546,7 @@ class LibcurlConan(ConanFile):
         tc.variables["CURL_USE_WOLFSSL"] = self.options.with_ssl == "wolfssl"
         tc.variables["CURL_USE_MBEDTLS"] = self.options.with_ssl == "mbedtls"
         tc.variables["USE_NGHTTP2"] = self.options.with_nghttp2
+        tc.variables["USE_OPENSSL_QUIC"] = self.options.with_nghttp3
         tc.variables["CURL_ZLIB"] = self.options.with_zlib
         tc.variables["CURL_BROTLI"] = self.options.with_brotli
         tc.variables["CURL_ZSTD"] = self.options.with_zstd
@@ -607,6 +638,10 @@ class LibcurlConan(ConanFile):
             deps.set_property("libnghttp2", "cmake_file_name", "NGHTTP2")
             deps.set_property("libnghttp2", "cmake_target_name", "CURL::nghttp2")
 
+        if self.options.with_nghttp3:
+            deps.set_property("nghttp3", "cmake_file_name", "NGHTTP3")
+            deps.set_property("nghttp3", "cmake_target_name", "CURL::nghttp3")
+
         if self.options.with_ssl == "wolfssl":
             deps.set_property("wolfssl", "cmake_target_name", "CURL::wolfssl")
         # Now the rest of the dependencies that don't use the imported target directly
@@ -690,6 +725,8 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("openldap::openldap")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.with_nghttp3:
+            self.cpp_info.components["curl"].requires.append("nghttp3::nghttp3")
         if self.options.with_libssh2:
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_zlib:
@@ -27,16 +27,42 @@ class LibVPXConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "runtime_cpu_detect": [True, False],
+        "vp8_encoder": [True, False],
+        "vp8_decoder": [True, False],
+        "vp9_encoder": [True, False],
+        "vp9_decoder": [True, False],
+        "multithread": [True, False],
+        "realtime_only": [True, False],
+        "multi_res_encoding": [True, False],
+        "vp9_temporal_denoising": [True, False],
+        "size_limit": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "runtime_cpu_detect": True,
+        "vp8_encoder": True,
+        "vp8_decoder": True,
+        "vp9_encoder": True,
+        "vp9_decoder": True,
+        "multithread": True,
+        "realtime_only": False,
+        "multi_res_encoding": False,
+        "vp9_temporal_denoising": False,
+        "size_limit": None,
     }
 
     _arch_options = ['mmx', 'sse', 'sse2', 'sse3', 'ssse3', 'sse4_1', 'avx', 'avx2', 'avx512']
 
     options.update({name: [True, False] for name in _arch_options})
-    default_options.update({name: 'avx' not in name for name in _arch_options})
+    default_options.update({name: True for name in _arch_options})
+    # 'auto': enabled with runtime_cpu_detect, which only uses them on CPUs supporting them,
+    # disabled otherwise as they would be required by the resulting binaries
+    options.update({name: ["auto", True, False] for name in ['avx', 'avx2', 'avx512']})
+    default_options.update({name: "auto" for name in ['avx', 'avx2', 'avx512']})
+
+    _codec_options = ['vp8_encoder', 'vp8_decoder', 'vp9_encoder', 'vp9_decoder']
 
     @property
     def _settings_build(self):
@@ -51,6 +77,8 @@ class LibVPXConan(ConanFile):
         if str(self.settings.arch) not in ['x86', 'x86_64']:
             for name in self._arch_options:
                 delattr(self.options, name)
+        if not (str(self.settings.arch) in ['x86', 'x86_64'] or str(self.settings.arch).startswith(('armv7', 'armv8'))):
+            del self.options.runtime_cpu_detect
 
     def configure(self):
         if self.settings.os == "Windows":
@@ -70,6 +98,14 @@ class LibVPXConan(ConanFile):
             raise ConanInvalidConfiguration(f"Unsupported compiler {self.settings.compiler}")
         if self.settings.os == "iOS" and (self.settings.os.sdk != "iphonesimulator" and self.settings.arch in ["x86_64", "x86"]):
             raise ConanInvalidConfiguration("iOS platform with x86/x86_64 architectures only supports 'iphonesimulator' SDK option")
+        if not any(self.options.get_safe(name) for name in self._codec_options):
+            raise ConanInvalidConfiguration(f"At least one of {', '.join(self._codec_options)} must be enabled")
+        if self.options.multi_res_encoding and not self.options.vp8_encoder:
+            raise ConanInvalidConfiguration("multi_res_encoding=True requires vp8_encoder=True")
+        if self.options.vp9_temporal_denoising and not self.options.vp9_encoder:
+            raise ConanInvalidConfiguration("vp9_temporal_denoising=True requires vp9_encoder=True")
+        if self.options.size_limit and not re.fullmatch(r"[1-9][0-9]*x[1-9][0-9]*", str(self.options.size_limit)):
+            raise ConanInvalidConfiguration(f"size_limit must be given as WIDTHxHEIGHT, got '{self.options.size_limit}'")
 
     def build_requirements(self):
         if self.settings.arch in ["x86", "x86_64"]:
@@ -82,6 +118,12 @@ class LibVPXConan(ConanFile):
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
+    def _arch_option_enabled(self, name):
+        value = str(self.options.get_safe(name))
+        if value == "auto":
+            return bool(self.options.get_safe("runtime_cpu_detect"))
+        return value == "True"
+
     @property
     def _install_tmp_folder(self):
         return "tmp_install"
@@ -162,8 +204,22 @@ class LibVPXConan(ConanFile):
             tc.configure_args.append("--enable-static-msvcrt")
         if str(self.settings.arch) in ["x86", "x86_64"]:
             for name in self._arch_options:
-                if not self.options.get_safe(name):
+                if not self._arch_option_enabled(name):
                     tc.configure_args.append(f"--disable-{name}")
+        if "runtime_cpu_detect" in self.options:
+            tc.configure_args.append(f"--{self._enable_disable(self.options.runtime_cpu_detect)}-runtime-cpu-detect")
+        for name in self._codec_options:
+            tc.configure_args.append(f"--{self._enable_disable(self.options.get_safe(name))}-{name.replace('_', '-')}")
+        tc.configure_args.extend([
+            f"--{self._enable_disable(self.options.multithread)}-multithread",
+            f"--{self._enable_disable(self.options.realtime_only)}-realtime-only",
+        ])
+        if self.options.multi_res_encoding:
+            tc.configure_args.append("--enable-multi-res-encoding")
+        if self.options.vp9_temporal_denoising:
+            tc.configure_args.append("--enable-vp9-temporal-denoising")
+        if self.options.size_limit:
+            tc.configure_args.append(f"--size-limit={self.options.size_limit}")
 
         tc.update_configure_args({
             # libvpx does not like --prefix=/ as it fails the test for "libdir
@@ -190,6 +246,10 @@ class LibVPXConan(ConanFile):
             env = tc.environment()
         tc.generate(env)
 
+    @staticmethod
+    def _enable_disable(value):
+        return "enable" if value else "disable"
+
     def _patch_sources(self):
         apply_conandata_patches(self)
 
@@ -1,6 +1,6 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
-from conan.tools.build import cross_building, stdcpp_library
+from conan.errors import ConanException, ConanInvalidConfiguration
+from conan.tools.build import build_jobs, cross_building, stdcpp_library
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rename, rm, rmdir
@@ -25,6 +25,11 @@ class Libx265Conan(ConanFile):
         "fPIC": [True, False],
         "assembly": [True, False],
         "bit_depth": [8, 10, 12],
+        "multilib": [True, False],
+        "avx512": [True, False],
+        "neon": [True, False],
+        "sve": [True, False],
+        "sve2": [True, False],
         "HDR10": [True, False],
         "SVG_HEVC_encoder": [True, False],
         "with_numa": [True, False],
@@ -34,6 +39,11 @@ class Libx265Conan(ConanFile):
         "fPIC": True,
         "assembly": True,
         "bit_depth": 8,
+        "multilib": False,
+        "avx512": False,
+        "neon": True,
+        "sve": True,
+        "sve2": True,
         "HDR10": False,
         "SVG_HEVC_encoder": False,
         "with_numa": False,
@@ -47,6 +57,12 @@ class Libx265Conan(ConanFile):
             del self.options.fPIC
         if self.settings.os != "Linux":
             del self.options.with_numa
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.avx512
+        if self.settings.arch != "armv8":
+            del self.options.neon
+            del self.options.sve
+            del self.options.sve2
         # FIXME: Disable assembly by default if host is arm and compiler apple-clang for the moment.
         # Indeed, apple-clang is not able to understand some asm instructions of libx265
         # FIXME: Disable assembly by default if host is Android for the moment. It fails to build
@@ -59,6 +75,14 @@ class Libx265Conan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.multilib:
+            # 8, 10 and 12 bit encoders are all in the library
+            del self.options.bit_depth
+        if not self.options.assembly:
+            self.options.rm_safe("avx512")
+            self.options.rm_safe("neon")
+            self.options.rm_safe("sve")
+            self.options.rm_safe("sve2")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -106,8 +130,13 @@ class Libx265Conan(ConanFile):
         tc.variables["ENABLE_LIBNUMA"] = self.options.get_safe("with_numa", False)
         if self.settings.os == "Macos":
             tc.variables["CMAKE_SHARED_LINKER_FLAGS"] = "-Wl,-read_only_relocs,suppress"
-        tc.variables["HIGH_BIT_DEPTH"] = self.options.bit_depth != 8
-        tc.variables["MAIN12"] = self.options.bit_depth == 12
+        if not self.options.multilib:
+            tc.variables["HIGH_BIT_DEPTH"] = self.options.bit_depth != 8
+            tc.variables["MAIN12"] = self.options.bit_depth == 12
+        if "neon" in self.options:
+            tc.variables["ENABLE_NEON"] = self.options.neon
+            tc.variables["ENABLE_SVE"] = self.options.sve
+            tc.variables["ENABLE_SVE2"] = self.options.sve2
         tc.variables["ENABLE_HDR10_PLUS"] = self.options.HDR10
         tc.variables["ENABLE_SVT_HEVC"] = self.options.SVG_HEVC_encoder
         if is_msvc(self):
@@ -135,11 +164,55 @@ class Libx265Conan(ConanFile):
         replace_in_file(self, cmakelists,
                         "add_definitions(-ffast-math)",
                         "add_definitions(-ffast-math -fno-finite-math-only)")
+        if self.options.get_safe("avx512"):
+            # AVX-512 kernels are always assembled, but only used when explicitly requested (--asm avx512)
+            replace_in_file(self, os.path.join(self.source_folder, "source", "common", "param.cpp"),
+                            "param->cpuid = X265_NS::cpu_detect(false);",
+                            "param->cpuid = X265_NS::cpu_detect(true);")
+
+    @property
+    def _multilib_folder(self):
+        return os.path.join(self.build_folder, "multilib")
+
+    def _multilib_name(self, bit_depth):
+        return f"x265_main{bit_depth}.lib" if is_msvc(self) else f"libx265_main{bit_depth}.a"
+
+    def _build_high_bit_depth_libs(self, cmake):
+        # Same steps as upstream build/linux/multilib.sh: 12 and 10 bit encoders are built as static
+        # libraries without C API, each in its own build folder, then linked into the 8 bit library
+        # which dispatches to them.
+        static_lib = "x265-static.lib" if is_msvc(self) else "libx265.a"
+        for bit_depth in (12, 10):
+            bit_depth_folder = os.path.join(self.build_folder, f"main{bit_depth}")
+            cmake.configure(build_script_folder=os.path.join(self.source_folder, "source"), variables={
+                "HIGH_BIT_DEPTH": True,
+                "MAIN12": bit_depth == 12,
+                "EXPORT_C_API": False,
+                "ENABLE_SHARED": False,
+                "ENABLE_CLI": False,
+            }, cli_args=[f'-B "{bit_depth_folder}"'])
+            parallel = f" --parallel {build_jobs(self)}" if build_jobs(self) else ""
+            self.run(f'cmake --build "{bit_depth_folder}" --target x265-static --config {self.settings.build_type}{parallel}')
+            for folder in (os.path.join(bit_depth_folder, str(self.settings.build_type)), bit_depth_folder):
+                if os.path.isfile(os.path.join(folder, static_lib)):
+                    copy(self, static_lib, src=folder, dst=self._multilib_folder)
+                    rename(self, os.path.join(self._multilib_folder, static_lib),
+                                 os.path.join(self._multilib_folder, self._multilib_name(bit_depth)))
+                    break
+            else:
+                raise ConanException(f"{static_lib} not found after building the {bit_depth} bit encoder")
+        return {
+            "EXTRA_LIB": ";".join(os.path.join(self._multilib_folder, self._multilib_name(bit_depth)).replace("\\", "/")
+                                  for bit_depth in (10, 12)),
+            "LINKED_10BIT": True,
+            "LINKED_12BIT": True,
+        }
 
     def build(self):
         self._patch_sources()
         cmake = CMake(self)
-        cmake.configure(build_script_folder=os.path.join(self.source_folder, "source"))
+        variables = self._build_high_bit_depth_libs(cmake) if self.options.multilib else None
+        cmake.configure(build_script_folder=os.path.join(self.source_folder, "source"), variables=variables)
         cmake.build()
 
     def package(self):
@@ -164,10 +237,15 @@ class Libx265Conan(ConanFile):
         else:
             rmdir(self, os.path.join(self.package_folder, "bin"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        if self.options.multilib and not self.options.shared:
+            for bit_depth in (10, 12):
+                copy(self, self._multilib_name(bit_depth), src=self._multilib_folder, dst=os.path.join(self.package_folder, "lib"))
 
     def package_info(self):
         self.cpp_info.set_property("pkg_config_name", "x265")
         self.cpp_info.libs = ["x265"]
+        if self.options.multilib and not self.options.shared:
+            self.cpp_info.libs.extend(["x265_main10", "x265_main12"])
         if self.settings.os == "Windows":
             if self.options.shared:
                 self.cpp_info.defines.append("X265_API_IMPORTS")
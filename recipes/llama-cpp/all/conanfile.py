@@ -6,7 +6,7 @@ from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os
 from conan.tools.build import check_min_cppstd, cross_building
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import save, copy, get, rmdir
+from conan.tools.files import save, copy, get, load, replace_in_file, rmdir
 
 required_conan_version = ">=2.0.9"
 
@@ -28,6 +28,15 @@ class LlamaCppConan(ConanFile):
         "with_cuda": [True, False],
         "with_curl": [True, False],
         "with_vulkan": [True, False],
+        "with_blas": [False, "openblas"],
+        "with_openmp": [True, False],
+        "with_llamafile": [True, False],
+        "cpu_all_variants": [True, False],
+        "avx": ["auto", True, False],
+        "avx2": ["auto", True, False],
+        "avx512": ["auto", True, False],
+        "fma": ["auto", True, False],
+        "f16c": ["auto", True, False],
     }
     default_options = {
         "shared": False,
@@ -36,6 +45,28 @@ class LlamaCppConan(ConanFile):
         "with_cuda": False,
         "with_curl": False,
         "with_vulkan": False,
+        "with_blas": False,
+        "with_openmp": True,
+        "with_llamafile": True,
+        "cpu_all_variants": False,
+        "avx": "auto",
+        "avx2": "auto",
+        "avx512": "auto",
+        "fma": "auto",
+        "f16c": "auto",
+    }
+    options_description = {
+        "with_blas": "Build the ggml BLAS backend, used for prompt processing",
+        "with_openmp": "Use OpenMP for the ggml CPU backend instead of the ggml threadpool",
+        "with_llamafile": "Use the llamafile (tinyBLAS) sgemm kernels",
+        "cpu_all_variants": "Build one CPU backend per x86 ISA level and select the best one at runtime "
+                            "(GGML_CPU_ALL_VARIANTS, requires shared=True). The backend modules are looked up "
+                            "in the directory given by the GGML_BACKEND_DIR environment variable",
+        "avx": "Force AVX on/off. 'auto' means native detection, or on when another ISA option is forced",
+        "avx2": "Force AVX2 on/off. 'auto' means native detection, or on when another ISA option is forced",
+        "avx512": "Force AVX512 on/off. 'auto' means native detection, or off when another ISA option is forced",
+        "fma": "Force FMA on/off. 'auto' means native detection, or on when another ISA option is forced",
+        "f16c": "Force F16C on/off. 'auto' means native detection, or on when another ISA option is forced",
     }
 
     implements = ["auto_shared_fpic"]
@@ -45,6 +76,28 @@ class LlamaCppConan(ConanFile):
             del self.options.fPIC
         if is_apple_os(self):
             del self.options.with_vulkan
+            # Accelerate is always used as BLAS backend
+            del self.options.with_blas
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.cpu_all_variants
+            del self.options.avx
+            del self.options.avx2
+            del self.options.avx512
+            del self.options.fma
+            del self.options.f16c
+
+    @property
+    def _x86_isa_options(self):
+        return ["avx", "avx2", "avx512", "fma", "f16c"]
+
+    @property
+    def _x86_isa_portable_defaults(self):
+        # ggml's own defaults for a non-native build (INS_ENB), used for the 'auto' values
+        return {"avx": True, "avx2": True, "avx512": False, "fma": True, "f16c": True}
+
+    @property
+    def _explicit_x86_isa(self):
+        return any(self.options.get_safe(isa, "auto") != "auto" for isa in self._x86_isa_options)
 
     @property
     def _cuda_build_module(self):
@@ -63,6 +116,13 @@ class LlamaCppConan(ConanFile):
 
     def validate(self):
         check_min_cppstd(self, 17)
+        if self.options.get_safe("cpu_all_variants"):
+            if not self.options.shared:
+                # GGML_CPU_ALL_VARIANTS relies on backends loaded at runtime (GGML_BACKEND_DL)
+                raise ConanInvalidConfiguration(f"-o {self.ref}:cpu_all_variants=True requires -o {self.ref}:shared=True")
+            if self._explicit_x86_isa:
+                raise ConanInvalidConfiguration(f"-o {self.ref}:cpu_all_variants=True can not be combined with explicit "
+                                                f"{'/'.join(self._x86_isa_options)} options")
 
     def validate_build(self):
         if self.settings.compiler == "msvc" and "arm" in self.settings.arch:
@@ -78,6 +138,9 @@ class LlamaCppConan(ConanFile):
         if self.options.get_safe("with_vulkan"):
             self.requires("vulkan-loader/[>=1.3 <1.5]")
 
+        if self.options.get_safe("with_blas") == "openblas":
+            self.requires("openblas/[>=0.3.24 <1]")
+
     def build_requirements(self):
         if self.options.get_safe("with_vulkan"):
             self.tool_requires("shaderc/[>=2025.3]")
@@ -87,6 +150,7 @@ class LlamaCppConan(ConanFile):
 
     def generate(self):
         deps = CMakeDeps(self)
+        deps.set_property("openblas", "cmake_file_name", "BLAS")
         deps.generate()
 
         tc = CMakeToolchain(self)
@@ -95,9 +159,22 @@ class LlamaCppConan(ConanFile):
         tc.variables["LLAMA_BUILD_TESTS"] = False
         tc.variables["LLAMA_BUILD_EXAMPLES"] = self.options.get_safe("with_examples")
         tc.variables["LLAMA_CURL"] = self.options.get_safe("with_curl")
-        if cross_building(self):
+        if cross_building(self) or self.options.get_safe("cpu_all_variants") or self._explicit_x86_isa:
             tc.variables["LLAMA_NATIVE"] = False
             tc.variables["GGML_NATIVE_DEFAULT"] = False
+            tc.variables["GGML_NATIVE"] = False
+        if self._explicit_x86_isa:
+            for isa in self._x86_isa_options:
+                value = self.options.get_safe(isa)
+                tc.variables[f"GGML_{isa.upper()}"] = self._x86_isa_portable_defaults[isa] if value == "auto" else bool(value)
+        if self.options.get_safe("cpu_all_variants"):
+            tc.variables["GGML_BACKEND_DL"] = True
+            tc.variables["GGML_CPU_ALL_VARIANTS"] = True
+        tc.variables["GGML_OPENMP"] = bool(self.options.with_openmp)
+        tc.variables["GGML_LLAMAFILE"] = bool(self.options.with_llamafile)
+        if self.options.get_safe("with_blas") == "openblas":
+            tc.variables["GGML_BLAS"] = True
+            tc.variables["GGML_BLAS_VENDOR"] = "OpenBLAS"
 
         tc.variables["GGML_BUILD_TESTS"] = False
         # Follow with_examples when newer versions can compile examples,
@@ -112,7 +189,21 @@ class LlamaCppConan(ConanFile):
 
         tc.generate()
 
+    def _patch_sources(self):
+        if self.options.get_safe("cpu_all_variants"):
+            # Backend modules are installed in the package, not next to the consumer executables
+            # that ggml searches by default: also look in GGML_BACKEND_DIR from the environment
+            backend_reg = os.path.join(self.source_folder, "ggml", "src", "ggml-backend-reg.cpp")
+            replace_in_file(self, backend_reg,
+                            "search_paths.push_back(get_executable_path());",
+                            "if (const char * env_backend_dir = std::getenv(\"GGML_BACKEND_DIR\")) {\n"
+                            "            search_paths.push_back(fs::u8path(env_backend_dir));\n"
+                            "        }\n"
+                            "        search_paths.push_back(get_executable_path());")
+            save(self, backend_reg, "#include <cstdlib>\n" + load(self, backend_reg))
+
     def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
@@ -142,6 +233,8 @@ class LlamaCppConan(ConanFile):
             results.append("cuda")
         if self.options.get_safe("with_vulkan"):
             results.append("vulkan")
+        if self.options.get_safe("with_blas"):
+            results.append("blas")
         return results
 
     def package_info(self):
@@ -166,7 +259,9 @@ class LlamaCppConan(ConanFile):
         if is_apple_os(self):
             self.cpp_info.components["common"].frameworks.extend(["Foundation", "Accelerate", "Metal"])
         elif self.settings.os in ("Linux", "FreeBSD"):
-            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread", "gomp"])
+            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread"])
+            if self.options.with_openmp:
+                self.cpp_info.components["common"].system_libs.append("gomp")
 
         if self.options.with_cuda and not self.options.shared:
             self.cpp_info.builddirs.append(os.path.join("lib", "cmake"))
@@ -187,11 +282,19 @@ class LlamaCppConan(ConanFile):
             self.cpp_info.components["ggml-base"].defines.append("GGML_SHARED")
             self.cpp_info.components["ggml"].defines.append("GGML_SHARED")
 
+        backend_dl = self.options.get_safe("cpu_all_variants")
+        if backend_dl:
+            # With GGML_BACKEND_DL every backend (including one ggml-cpu-<variant> per ISA level)
+            # is a module installed in bin and loaded at runtime by ggml, none of them is linked
+            self.runenv_info.define_path("GGML_BACKEND_DIR", os.path.join(self.package_folder, "bin"))
+
         backends = self._get_backends()
         for backend in backends:
+            self.cpp_info.components[f"ggml-{backend}"].set_property("cmake_target_name", f"ggml-{backend}")
+            if backend_dl:
+                continue
             self.cpp_info.components[f"ggml-{backend}"].libs = [f"ggml-{backend}"]
             self.cpp_info.components[f"ggml-{backend}"].resdirs = ["res"]
-            self.cpp_info.components[f"ggml-{backend}"].set_property("cmake_target_name", f"ggml-{backend}")
             if self.options.shared:
                 self.cpp_info.components[f"ggml-{backend}"].defines.append("GGML_BACKEND_SHARED")
             self.cpp_info.components["ggml"].defines.append(f"GGML_USE_{backend.upper()}")
@@ -199,6 +302,8 @@ class LlamaCppConan(ConanFile):
 
             if backend == "vulkan":
                 self.cpp_info.components["ggml-vulkan"].requires.append("vulkan-loader::vulkan-loader")
+            if backend == "blas" and not is_apple_os(self):
+                self.cpp_info.components["ggml-blas"].requires.append("openblas::openblas")
 
         if is_apple_os(self):
             if "blas" in backends:
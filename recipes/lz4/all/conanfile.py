@@ -20,10 +20,22 @@ class LZ4Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "heapmode": [True, False],
+        "memory_usage": list(range(10, 21)),
+        "build_programs": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "heapmode": False,
+        "memory_usage": 14,
+        "build_programs": False,
+    }
+    options_description = {
+        "heapmode": "LZ4_HEAPMODE: allocate the compression state on the heap instead of the stack",
+        "memory_usage": "LZ4_MEMORY_USAGE: log2 of the hash table size in bytes (14 is 16 KiB), "
+                        "trades compression ratio against speed and cache residency",
+        "build_programs": "Build the lz4 command line program (multithreaded compression since 1.10.0)",
     }
 
     def export_sources(self):
@@ -39,6 +51,15 @@ class LZ4Conan(ConanFile):
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
 
+    @property
+    def _public_definitions(self):
+        # These change declarations in lz4.h (e.g. the size of LZ4_stream_t),
+        # so consumers must see the same values as the library
+        definitions = {}
+        if self.options.memory_usage != 14:
+            definitions["LZ4_MEMORY_USAGE"] = str(self.options.memory_usage)
+        return definitions
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -49,11 +70,15 @@ class LZ4Conan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["LZ4_BUILD_CLI"] = False
+        tc.variables["LZ4_BUILD_CLI"] = self.options.build_programs
         if Version(self.version) < "1.10.0":
             tc.variables["LZ4_BUILD_LEGACY_LZ4C"] = False
         tc.variables["LZ4_BUNDLED_MODE"] = False
         tc.variables["LZ4_POSITION_INDEPENDENT_LIB"] = self.options.get_safe("fPIC", True)
+        for name, value in self._public_definitions.items():
+            tc.preprocessor_definitions[name] = value
+        if self.options.heapmode:
+            tc.preprocessor_definitions["LZ4_HEAPMODE"] = "1"
         # Generate a relocatable shared lib on Macos
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
         # Honor BUILD_SHARED_LIBS (see https://github.com/conan-io/conan/issues/11840)
@@ -93,3 +118,4 @@ class LZ4Conan(ConanFile):
         self.cpp_info.libs = ["lz4"]
         if is_msvc(self) and self.options.shared:
             self.cpp_info.defines.append("LZ4_DLL_IMPORT=1")
+        self.cpp_info.defines.extend(f"{name}={value}" for name, value in self._public_definitions.items())
@@ -25,17 +25,44 @@ class OneTBBConan(ConanFile):
     options = {
         "tbbmalloc": [True, False],
         "tbbproxy": [True, False],
+        "tbbproxy_replace_malloc": [True, False],
         "tbbbind": [True, False],
         "interprocedural_optimization": [True, False],
+        "strict": [True, False],
         "build_apple_frameworks": [True, False],
+        "build_examples": [True, False],
     }
     default_options = {
         "tbbmalloc": True,
         "tbbproxy": True,
+        "tbbproxy_replace_malloc": False,
         "tbbbind": True,
         "interprocedural_optimization": True,
+        "strict": False,
         "build_apple_frameworks": False,
+        "build_examples": False,
     }
+    options_description = {
+        "tbbproxy_replace_malloc": "Make executables linking the tbbmalloc_proxy component replace malloc/new "
+                                   "of the whole process by tbbmalloc, even if they don't reference its symbols",
+        "interprocedural_optimization": "Value of TBB_ENABLE_IPO",
+        "strict": "Value of TBB_STRICT: treat compiler warnings as errors",
+        "build_examples": "Package the parallel_for, parallel_reduce and flow graph examples as executables, "
+                          "to measure the scheduler scalability of the packaged build",
+    }
+
+    @property
+    def _examples(self):
+        return [
+            # parallel_for
+            "game_of_life", "polygon_overlay", "seismic", "tachyon",
+            # parallel_reduce
+            "convex_hull_bench", "convex_hull_sample", "pi", "primes",
+            # graph
+            "binpack", "cholesky", "dining_philosophers", "fgbzip2", "logic_sim", "som",
+            # test_all
+            "fibonacci",
+        ]
 
     def config_options(self):
         if self.settings.os == "Windows" and self.settings.arch == "armv8":
@@ -52,6 +79,8 @@ class OneTBBConan(ConanFile):
     def configure(self):
         if not self.options.tbbmalloc:
             self.options.rm_safe("tbbproxy")
+        if not self.options.get_safe("tbbproxy"):
+            self.options.rm_safe("tbbproxy_replace_malloc")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -75,7 +104,11 @@ class OneTBBConan(ConanFile):
         if self.options.get_safe("tbbbind"):
             tc.cache_variables["CMAKE_PROJECT_TBB_INCLUDE"] = os.path.join(self.build_folder, "find_hwloc.cmake")
         tc.cache_variables["TBB_TEST"] = False
-        tc.cache_variables["TBB_STRICT"] = False
+        tc.cache_variables["TBB_STRICT"] = self.options.strict
+        tc.cache_variables["TBB_EXAMPLES"] = self.options.build_examples
+        if self.options.build_examples:
+            # Console mode, GUI modes need X11/GDI
+            tc.cache_variables["EXAMPLES_UI_MODE"] = "con"
         tc.cache_variables["TBBMALLOC_BUILD"] = self.options.tbbmalloc
         if self.options.get_safe("interprocedural_optimization") is not None:
             tc.cache_variables["TBB_ENABLE_IPO"] = self.options.interprocedural_optimization
@@ -109,6 +142,11 @@ class OneTBBConan(ConanFile):
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
         rm(self, "*.pdb", os.path.join(self.package_folder, "bin"))
+        if self.options.build_examples:
+            # Examples are not installed by upstream
+            for example in self._examples:
+                copy(self, f"*/{example}", src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
+                copy(self, f"*/{example}.exe", src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
 
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "TBB")
@@ -162,3 +200,13 @@ class OneTBBConan(ConanFile):
                 tbbproxy.requires = ["tbbmalloc"]
                 if self.settings.os in ["Linux", "FreeBSD"]:
                     tbbproxy.system_libs = ["m", "dl", "pthread"]
+
+                if self.options.get_safe("tbbproxy_replace_malloc"):
+                    # The proxy has to be loaded even if no symbol is referenced, see
+                    # https://uxlfoundation.github.io/oneTBB/main/tbb_userguide/Automatically_Replacing_malloc.html
+                    if is_msvc(self):
+                        proxy_symbol = "___TBB_malloc_proxy" if self.settings.arch == "x86" else "__TBB_malloc_proxy"
+                        tbbproxy.exelinkflags = [f"/INCLUDE:{proxy_symbol}"]
+                    elif self.settings.os in ["Linux", "FreeBSD", "Android"]:
+                        proxy_lib = os.path.join(self.package_folder, "lib", f"lib{lib_name('tbbmalloc_proxy')}.so")
+                        tbbproxy.exelinkflags = ["-Wl,--push-state,--no-as-needed", proxy_lib, "-Wl,--pop-state"]
@@ -25,12 +25,33 @@ class OnnxRuntimeConan(ConanFile):
         "fPIC": [True, False],
         "with_xnnpack": [True, False],
         "with_cuda": [True, False],
+        "enable_cpu_fp16_ops": [True, False],
+        "disable_contrib_ops": [True, False],
+        "minimal_build": [False, "basic", "extended"],
+        "disable_rtti": [True, False],
+        "disable_exceptions": [True, False],
+        "enable_lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_xnnpack": False,
         "with_cuda": False,
+        "enable_cpu_fp16_ops": False,
+        "disable_contrib_ops": False,
+        "minimal_build": False,
+        "disable_rtti": False,
+        "disable_exceptions": False,
+        "enable_lto": False,
+    }
+    options_description = {
+        "enable_cpu_fp16_ops": "Build the MLAS fp16 kernels for the CPU execution provider",
+        "disable_contrib_ops": "Exclude the contrib (non-ONNX standard) operators",
+        "minimal_build": "Reduced size build which can only load ORT format models. "
+                         "'extended' additionally keeps runtime graph optimizations",
+        "disable_rtti": "Build without RTTI, requires protobuf lite",
+        "disable_exceptions": "Build without exceptions, only supported by minimal builds",
+        "enable_lto": "Enable link time optimization",
     }
     short_paths = True
 
@@ -83,6 +104,14 @@ class OnnxRuntimeConan(ConanFile):
             # Commented here: https://github.com/onnx/onnx/pull/7505#issuecomment-3601468150
             raise ConanInvalidConfiguration("There are link errors using 'onnx/*:shared=True',"
                                             " use '-o onnx/*:shared=False' instead.")
+        if self.options.disable_rtti and not self.dependencies["protobuf"].options.lite:
+            # Full protobuf relies on RTTI
+            raise ConanInvalidConfiguration(f"-o {self.ref}:disable_rtti=True requires '-o protobuf/*:lite=True'")
+        if self.options.disable_exceptions and not self.options.minimal_build:
+            raise ConanInvalidConfiguration(f"-o {self.ref}:disable_exceptions=True is only supported together with"
+                                            f" -o {self.ref}:minimal_build=basic|extended")
+        if self.options.minimal_build and self.options.with_cuda:
+            raise ConanInvalidConfiguration(f"-o {self.ref}:minimal_build is not supported together with CUDA")
 
     def validate_build(self):
         if self.settings.os == "Windows" and self.dependencies["abseil"].options.shared:
@@ -106,14 +135,17 @@ class OnnxRuntimeConan(ConanFile):
 
         tc.variables["onnxruntime_USE_CUDA"] = self.options.with_cuda
         tc.variables["onnxruntime_BUILD_UNIT_TESTS"] = False
-        tc.variables["onnxruntime_DISABLE_CONTRIB_OPS"] = False
+        tc.variables["onnxruntime_DISABLE_CONTRIB_OPS"] = self.options.disable_contrib_ops
         tc.variables["onnxruntime_USE_FLASH_ATTENTION"] = False
-        tc.variables["onnxruntime_DISABLE_RTTI"] = False
-        tc.variables["onnxruntime_DISABLE_EXCEPTIONS"] = False
+        tc.variables["onnxruntime_DISABLE_RTTI"] = self.options.disable_rtti
+        tc.variables["onnxruntime_DISABLE_EXCEPTIONS"] = self.options.disable_exceptions
+        tc.variables["onnxruntime_MINIMAL_BUILD"] = bool(self.options.minimal_build)
+        tc.variables["onnxruntime_EXTENDED_MINIMAL_BUILD"] = self.options.minimal_build == "extended"
+        tc.variables["onnxruntime_ENABLE_LTO"] = self.options.enable_lto
 
         tc.variables["onnxruntime_ARMNN_RELU_USE_CPU"] = False
         tc.variables["onnxruntime_ARMNN_BN_USE_CPU"] = False
-        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = False
+        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = self.options.enable_cpu_fp16_ops
         tc.variables["onnxruntime_ENABLE_EAGER_MODE"] = False
         tc.variables["onnxruntime_ENABLE_LAZY_TENSOR"] = False
 
@@ -73,8 +73,12 @@ class OpenblasConan(ConanFile):
         "fPIC": [True, False],
         "build_lapack": [True, False],
         "build_relapack": [True, False],
-        "use_thread": [True, False],
+        "use_thread": [True, False, "deprecated"],
+        "threading": ["none", "pthreads", "openmp"],
         "use_locking": [True, False],
+        "use_tls": [True, False],
+        "num_threads": [None, "ANY"],
+        "num_parallel": [None, "ANY"],
         "dynamic_arch": [True, False],
         "target": [None] + available_openblas_targets
     }
@@ -83,16 +87,26 @@ class OpenblasConan(ConanFile):
         "fPIC": True,
         "build_lapack": True,
         "build_relapack": False,
-        "use_thread": True,
+        "use_thread": "deprecated",
+        "threading": "pthreads",
         "use_locking": True,
+        "use_tls": False,
+        "num_threads": None,
+        "num_parallel": None,
         "dynamic_arch": False,
         "target": None,
     }
     options_description = {
         "build_lapack": "Build LAPACK and LAPACKE",
         "build_relapack": "Build with ReLAPACK (recursive implementation of several LAPACK functions on top of standard LAPACK)",
-        "use_thread": "Enable threads support",
+        "use_thread": "Deprecated, use 'threading' instead",
+        "threading": "Threading backend: single-threaded, OpenBLAS' own pthreads pool or OpenMP "
+                     "(avoids oversubscription when the application already uses OpenMP)",
         "use_locking": "Use locks even in single-threaded builds to make them callable from multiple threads",
+        "use_tls": "Use thread-local storage for the memory buffers instead of a global locked pool (USE_TLS)",
+        "num_threads": "Maximum number of threads, which sizes the thread buffers (NUM_THREADS). "
+                       "Defaults to the number of cores of the build machine",
+        "num_parallel": "Number of threads from which OpenBLAS may be called concurrently (NUM_PARALLEL)",
         "dynamic_arch": "Include support for multiple CPU targets, with automatic selection at runtime (x86/x86_64, aarch64 or ppc only)",
         "target": "OpenBLAS TARGET variable (see TargetList.txt)",
     }
@@ -112,6 +126,9 @@ class OpenblasConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        # Deprecated options
+        if self.options.use_thread != "deprecated":
+            self.output.warning(f"The '{self.name}/*:use_thread' option is deprecated. Use '{self.name}/*:threading' instead.")
 
         # When cross-compiling, OpenBLAS requires explicitly setting TARGET
         if cross_building(self, skip_x64_x86=True) and not self.options.target:
@@ -121,6 +138,23 @@ class OpenblasConan(ConanFile):
                 self.output.warning(f'Setting OpenBLAS TARGET={target} based on settings.arch. This may result in suboptimal performance. Set the "{self.name}/*:target=XXX" option to silence this warning.')
                 self.options.target = target
 
+    @property
+    def _threading(self):
+        # The deprecated 'use_thread' option takes precedence when set
+        if self.options.use_thread != "deprecated":
+            return "pthreads" if self.options.use_thread else "none"
+        return str(self.options.threading)
+
+    def package_id(self):
+        if self.info.options.use_thread != "deprecated":
+            self.info.options.threading = "pthreads" if self.info.options.use_thread else "none"
+        del self.info.options.use_thread
+
+    def requirements(self):
+        if self._threading == "openmp" and self.settings.compiler == "clang":
+            # clang's -fopenmp links libomp, which is not part of the compiler runtime
+            self.requires("llvm-openmp/[>=17.0.6 <21]")
+
     def build_requirements(self):
         if Version(self.version) >= "0.3.29":
             self.tool_requires("cmake/[>=3.16 <4]")
@@ -132,6 +166,12 @@ class OpenblasConan(ConanFile):
             if self.settings.compiler not in ["gcc", "clang"]:
                 # ld: unknown option: --allow-multiple-definition on apple-clang
                 raise ConanInvalidConfiguration(f'"{self.name}/*:build_relapack=True" option is only supported for GCC and Clang')
+        if self._threading == "openmp" and self.settings.compiler not in ["gcc", "clang"]:
+            raise ConanInvalidConfiguration(f'"{self.name}/*:threading=openmp" option is only supported for GCC and Clang')
+        for option in ["num_threads", "num_parallel"]:
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f'"{self.name}/*:{option}" must be a positive integer')
 
     def validate_build(self):
         # If we're cross-compiling, and the user didn't provide the target, and
@@ -162,8 +202,14 @@ class OpenblasConan(ConanFile):
         tc.variables["BUILD_RELAPACK"] = self.options.build_relapack
 
         tc.variables["DYNAMIC_ARCH"] = self.options.dynamic_arch
-        tc.variables["USE_THREAD"] = self.options.use_thread
+        tc.variables["USE_THREAD"] = self._threading != "none"
+        tc.variables["USE_OPENMP"] = self._threading == "openmp"
         tc.variables["USE_LOCKING"] = self.options.use_locking
+        tc.variables["USE_TLS"] = self.options.use_tls
+        if self.options.num_threads:
+            tc.cache_variables["NUM_THREADS"] = str(self.options.num_threads)
+        if self.options.num_parallel:
+            tc.cache_variables["NUM_PARALLEL"] = str(self.options.num_parallel)
 
         tc.variables["MSVC_STATIC_CRT"] = is_msvc_static_runtime(self)
 
@@ -203,22 +249,33 @@ class OpenblasConan(ConanFile):
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
+        # - The threading runtime is also available to dependents as self.dependencies["openblas"].options.threading,
+        #   unless the deprecated use_thread option is used
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
         # 'pthread' causes issues without namespace
-        cmake_component_name = "pthread" if self.options.use_thread else "serial"  # TODO: how to model this in CMakeDeps?
+        cmake_component_name = {
+            "none": "serial",
+            "pthreads": "pthread",
+            "openmp": "openmp",
+        }[self._threading]  # TODO: how to model this in CMakeDeps?
         self.cpp_info.components["openblas_component"].set_property("cmake_target_name", f"OpenBLAS::{cmake_component_name}")
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(os.path.join("include", "openblas"))
         self.cpp_info.components["openblas_component"].libs = [self._lib_name]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["openblas_component"].system_libs.append("m")
-            if self.options.use_thread:
+            if self._threading != "none":
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
             if self.options.build_lapack and self._fortran_compiler:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
 
+        if self._threading == "openmp":
+            if self.settings.compiler == "clang":
+                self.cpp_info.components["openblas_component"].requires.append("llvm-openmp::llvm-openmp")
+            self.cpp_info.components["openblas_component"].sharedlinkflags.append("-fopenmp")
+            self.cpp_info.components["openblas_component"].exelinkflags.append("-fopenmp")
+
         self.buildenv_info.define_path("OpenBLAS_HOME", self.package_folder)
         self.runenv_info.define_path("OpenBLAS_HOME", self.package_folder)
@@ -8,6 +8,7 @@ from conan.tools.files import apply_conandata_patches, collect_libs, copy, expor
 from conan.tools.gnu import PkgConfigDeps
 from conan.tools.microsoft import is_msvc, msvc_runtime_flag
 from conan.tools.scm import Version
+import glob
 import os
 import re
 import textwrap
@@ -115,6 +116,8 @@ class OpenCVConan(ConanFile):
         "cuda_arch_bin": [None, "ANY"],
         "cpu_baseline": [None, "ANY"],
         "cpu_dispatch": [None, "ANY"],
+        "cpu_preset": [None, "sse4_2", "avx2", "avx512_skx", "neon"],
+        "build_perf_tests": [True, False],
         "world": [True, False],
         "nonfree": [True, False],
         # dnn module options
@@ -174,6 +177,8 @@ class OpenCVConan(ConanFile):
         "cuda_arch_bin": None,
         "cpu_baseline": None,
         "cpu_dispatch": None,
+        "cpu_preset": None,
+        "build_perf_tests": False,
         "world": False,
         "nonfree": False,
         # dnn module options
@@ -217,6 +222,13 @@ class OpenCVConan(ConanFile):
     }
     default_options.update({_name: True for _name in OPENCV_MAIN_MODULES_OPTIONS})
     default_options.update({_name: False for _name in OPENCV_EXTRA_MODULES_OPTIONS})
+    options_description = {
+        "cpu_baseline": "Value of CPU_BASELINE, comma separated list of OpenCV CPU features",
+        "cpu_dispatch": "Value of CPU_DISPATCH, comma separated list of OpenCV CPU features",
+        "cpu_preset": "Validated CPU_BASELINE/CPU_DISPATCH combination, overrides cpu_baseline and cpu_dispatch",
+        "build_perf_tests": "Package the opencv_perf_core and opencv_perf_imgproc performance tests, "
+                            "and the modules/ts scripts to run them and compare their results",
+    }
 
     short_paths = True
 
@@ -264,6 +276,33 @@ class OpenCVConan(ConanFile):
     def _has_with_wayland_option(self):
         return self.settings.os in ["Linux", "FreeBSD"]
 
+    @staticmethod
+    def _cpu_presets(settings):
+        # preset: (arches, CPU_BASELINE, CPU_DISPATCH)
+        # settings is a parameter as package_id() can only use self.info.settings
+        neon_dispatch = "NEON_FP16,NEON_BF16,NEON_DOTPROD" if settings.arch == "armv8" and settings.get_safe("compiler") != "msvc" else ""
+        return {
+            "sse4_2": (["x86", "x86_64"], "SSE4_2", "AVX,FP16,AVX2,AVX512_SKX"),
+            "avx2": (["x86_64"], "AVX2", "AVX512_SKX"),
+            "avx512_skx": (["x86_64"], "AVX512_SKX", ""),
+            "neon": (["armv7", "armv7hf", "armv8"], "NEON", neon_dispatch),
+        }
+
+    @staticmethod
+    def _normalize_cpu_features(value):
+        # OpenCV accepts comma, semicolon or space separated lists, in any order and case
+        if value is None:
+            return None
+        return ",".join(sorted({f.upper() for f in re.split(r"[,;\s]+", str(value)) if f}))
+
+    def _cpu_features(self, settings, options):
+        if options.cpu_preset:
+            _, baseline, dispatch = self._cpu_presets(settings)[str(options.cpu_preset)]
+            return baseline, dispatch
+        baseline = str(options.cpu_baseline) if options.cpu_baseline or options.cpu_baseline == "" else None
+        dispatch = str(options.cpu_dispatch) if options.cpu_dispatch or options.cpu_dispatch == "" else None
+        return baseline, dispatch
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -1109,6 +1148,18 @@ class OpenCVConan(ConanFile):
             self.requires("tesseract/5.5.2")
 
     def package_id(self):
+        # Equivalent CPU features lists and presets must give the same package_id
+        baseline, dispatch = (self._normalize_cpu_features(f) for f in self._cpu_features(self.info.settings, self.info.options))
+        self.info.options.cpu_preset = None
+        for preset, (arches, preset_baseline, preset_dispatch) in self._cpu_presets(self.info.settings).items():
+            preset_features = (self._normalize_cpu_features(preset_baseline), self._normalize_cpu_features(preset_dispatch))
+            if self.info.settings.arch in arches and (baseline, dispatch) == preset_features:
+                self.info.options.cpu_preset = preset
+                baseline = dispatch = None
+                break
+        self.info.options.cpu_baseline = baseline
+        self.info.options.cpu_dispatch = dispatch
+
         # deprecated options
         del self.info.options.contrib
         del self.info.options.contrib_freetype
@@ -1163,6 +1214,19 @@ class OpenCVConan(ConanFile):
             raise ConanInvalidConfiguration(
                 "viz module can't be enabled yet. It requires VTK which is not available in conan-center."
             )
+        if self.options.cpu_preset:
+            arches, baseline, dispatch = self._cpu_presets(self.settings)[str(self.options.cpu_preset)]
+            if self.settings.arch not in arches:
+                raise ConanInvalidConfiguration(f"cpu_preset={self.options.cpu_preset} is not available for {self.settings.arch}")
+            for option, value in [("cpu_baseline", baseline), ("cpu_dispatch", dispatch)]:
+                explicit = self.options.get_safe(option)
+                if (explicit or explicit == "") and self._normalize_cpu_features(explicit) != self._normalize_cpu_features(value):
+                    raise ConanInvalidConfiguration(f"{option} can't be set together with cpu_preset={self.options.cpu_preset}")
+        if self.options.build_perf_tests:
+            # Dependencies of the ts module
+            missing = [m for m in ["imgproc", "imgcodecs", "videoio", "highgui"] if not self.options.get_safe(m)]
+            if missing:
+                raise ConanInvalidConfiguration(f"build_perf_tests requires these modules: {', '.join(missing)}")
 
     def build_requirements(self):
         if self.options.get_safe("with_protobuf"):
@@ -1305,7 +1369,7 @@ class OpenCVConan(ConanFile):
         tc.variables["BUILD_TESTS"] = False
         tc.variables["BUILD_PROTOBUF"] = False
         tc.variables["BUILD_PACKAGE"] = False
-        tc.variables["BUILD_PERF_TESTS"] = False
+        tc.variables["BUILD_PERF_TESTS"] = self.options.build_perf_tests
         tc.variables["BUILD_USE_SYMLINKS"] = False
         tc.variables["BUILD_opencv_apps"] = False
         tc.variables["BUILD_opencv_java"] = False
@@ -1322,7 +1386,10 @@ class OpenCVConan(ConanFile):
         tc.variables["BUILD_opencv_python3"] = False
         tc.variables["BUILD_opencv_python_bindings_g"] = False
         tc.variables["BUILD_opencv_python_tests"] = False
-        tc.variables["BUILD_opencv_ts"] = False
+        tc.variables["BUILD_opencv_ts"] = self.options.build_perf_tests
+        if self.options.build_perf_tests:
+            tc.variables["INSTALL_TESTS"] = True
+            tc.variables["OPENCV_TEST_INSTALL_PATH"] = "bin"
 
         tc.variables["WITH_1394"] = False
         tc.variables["WITH_ARAVIS"] = False
@@ -1407,11 +1474,12 @@ class OpenCVConan(ConanFile):
         tc.variables["OPENCV_MODULES_PUBLIC"] = "opencv"
         tc.variables["OPENCV_ENABLE_NONFREE"] = self.options.nonfree
 
-        if self.options.cpu_baseline or self.options.cpu_baseline == "":
-            tc.variables["CPU_BASELINE"] = self.options.cpu_baseline
+        cpu_baseline, cpu_dispatch = self._cpu_features(self.settings, self.options)
+        if cpu_baseline is not None:
+            tc.variables["CPU_BASELINE"] = cpu_baseline
 
-        if self.options.cpu_dispatch or self.options.cpu_dispatch == "":
-            tc.variables["CPU_DISPATCH"] = self.options.cpu_dispatch
+        if cpu_dispatch is not None:
+            tc.variables["CPU_DISPATCH"] = cpu_dispatch
 
         tc.variables["OPENCV_DNN_CUDA"] = self.options.get_safe("dnn_cuda", False)
 
@@ -1526,6 +1594,16 @@ class OpenCVConan(ConanFile):
             rename(self, os.path.join(self.package_folder, "setup_vars_opencv4.cmd"),
                          os.path.join(self.package_folder, "res", "setup_vars_opencv4.cmd"))
 
+        if self.options.build_perf_tests:
+            # Only keep core and imgproc performance tests, accuracy tests are not built
+            for pattern in ["opencv_perf_*", "opencv_test_*", "opencv_run_all_tests*"]:
+                for path in glob.glob(os.path.join(self.package_folder, "bin", pattern)):
+                    if not os.path.basename(path).startswith(("opencv_perf_core", "opencv_perf_imgproc")):
+                        os.remove(path)
+            # run.py / summary.py to run the perf tests and compare their xml reports
+            copy(self, "*.py", src=os.path.join(self.source_folder, "modules", "ts", "misc"),
+                               dst=os.path.join(self.package_folder, "res", "ts"))
+
         self._create_cmake_module_variables(os.path.join(self.package_folder, self._module_vars_rel_path))
 
     def _create_cmake_module_variables(self, module_file):
@@ -1,9 +1,11 @@
 from conan import ConanFile
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, export_conandata_patches, copy, get, rmdir, replace_in_file
+from conan.errors import ConanException
+from conan.tools.files import apply_conandata_patches, export_conandata_patches, copy, get, load, rmdir, replace_in_file, save
 from conan.tools.scm import Version
 import os
+import re
 
 required_conan_version = ">=2.0"
 
@@ -21,10 +23,16 @@ class OpenEXRConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "threading": [True, False],
+        "core_only": [True, False],
+        "build_tools": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "threading": True,
+        "core_only": False,
+        "build_tools": True,
     }
 
     def export_sources(self):
@@ -37,6 +45,9 @@ class OpenEXRConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.core_only:
+            # Tools are built on top of the C++ library
+            del self.options.build_tools
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -58,10 +69,18 @@ class OpenEXRConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
+        # The examples link OpenEXR::OpenEXR, which is not built with core_only, and are not packaged
+        tc.variables["OPENEXR_BUILD_EXAMPLES"] = False
         tc.variables["OPENEXR_INSTALL_EXAMPLES"] = False
         tc.variables["BUILD_TESTING"] = False
         tc.variables["BUILD_WEBSITE"] = False
         tc.variables["DOCS"] = False
+        tc.variables["OPENEXR_ENABLE_THREADING"] = self.options.threading
+        tc.variables["OPENEXR_BUILD_TOOLS"] = self.options.get_safe("build_tools", False)
+        tc.variables["OPENEXR_INSTALL_TOOLS"] = self.options.get_safe("build_tools", False)
+        # Never fall back to the libdeflate copy bundled in OpenEXR
+        tc.variables["OPENEXR_FORCE_INTERNAL_DEFLATE"] = False
+        tc.cache_variables["CMAKE_REQUIRE_FIND_PACKAGE_libdeflate"] = True
         tc.generate()
 
         cd = CMakeDeps(self)
@@ -76,6 +95,14 @@ class OpenEXRConan(ConanFile):
                         "add_subdirectory(website/src)",
                         "#  add_subdirectory(website/src)")
 
+        if self.options.core_only:
+            lib_cmakelists = os.path.join(self.source_folder, "src", "lib", "CMakeLists.txt")
+            content, count = re.subn(r"^\s*add_subdirectory\s*\(\s*(?:Iex|IlmThread|OpenEXR|OpenEXRUtil)\s*\)\s*$", "",
+                                     load(self, lib_cmakelists), flags=re.MULTILINE)
+            if count != 4:
+                raise ConanException(f"Expected 4 C++ libraries in {lib_cmakelists}, found {count}")
+            save(self, lib_cmakelists, content)
+
     def build(self):
         self._patch_sources()
         cmake = CMake(self)
@@ -114,6 +141,23 @@ class OpenEXRConan(ConanFile):
         OpenEXRConfig = self._add_component("OpenEXRConfig")
         OpenEXRConfig.includedirs.append(os.path.join("include", "OpenEXR"))
 
+        # OpenEXR::OpenEXRCore
+        OpenEXRCore = self._add_component("OpenEXRCore")
+        OpenEXRCore.libs = [f"OpenEXRCore{lib_suffix}"]
+        OpenEXRCore.requires = [self._conan_comp("OpenEXRConfig"), "zlib::zlib"]
+        OpenEXRCore.requires.append("libdeflate::libdeflate")
+        if Version(self.version) >= "3.4":
+            OpenEXRCore.requires.append("openjph::openjph")
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            OpenEXRCore.system_libs = ["m"]
+            if self.options.threading:
+                OpenEXRCore.system_libs.append("pthread")
+
+        if self.options.core_only:
+            # half conversions come from Imath headers
+            OpenEXRCore.requires.append("imath::imath")
+            return
+
         # OpenEXR::IexConfig
         IexConfig = self._add_component("IexConfig")
         IexConfig.includedirs = OpenEXRConfig.includedirs
@@ -136,17 +180,7 @@ class OpenEXRConan(ConanFile):
             self._conan_comp("IlmThreadConfig"), self._conan_comp("Iex"),
         ]
         if self.settings.os in ["Linux", "FreeBSD"]:
-            IlmThread.system_libs = ["pthread", "m"]
-
-        # OpenEXR::OpenEXRCore
-        OpenEXRCore = self._add_component("OpenEXRCore")
-        OpenEXRCore.libs = [f"OpenEXRCore{lib_suffix}"]
-        OpenEXRCore.requires = [self._conan_comp("OpenEXRConfig"), "zlib::zlib"]
-        OpenEXRCore.requires.append("libdeflate::libdeflate")
-        if Version(self.version) >= "3.4":
-            OpenEXRCore.requires.append("openjph::openjph")
-        if self.settings.os in ["Linux", "FreeBSD"]:
-            OpenEXRCore.system_libs = ["m"]
+            IlmThread.system_libs = ["pthread", "m"] if self.options.threading else ["m"]
 
         # OpenEXR::OpenEXR
         OpenEXR = self._add_component("OpenEXR")
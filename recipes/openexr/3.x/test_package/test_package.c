@@ -0,0 +1,13 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+#include <openexr.h>
+
+int main(void)
+{
+    int major, minor, patch;
+    const char *extra;
+    exr_get_library_version(&major, &minor, &patch, &extra);
+    printf("OpenEXRCore %d.%d.%d%s\n", major, minor, patch, extra);
+    return EXIT_SUCCESS;
+}
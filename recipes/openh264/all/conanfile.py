@@ -1,7 +1,8 @@
 from conan import ConanFile
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import stdcpp_library
 from conan.tools.env import VirtualBuildEnv
-from conan.tools.files import copy, get, rmdir, rm, rename
+from conan.tools.files import copy, get, load, rmdir, rm, rename, save
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc
 from conan.tools.apple import fix_apple_shared_install_name
@@ -9,6 +10,7 @@ from conan.tools.scm import Version
 from conan.tools.meson import Meson, MesonToolchain
 
 import os
+import re
 
 
 required_conan_version = ">=2.0.9"
@@ -25,10 +27,18 @@ class OpenH264Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "assembly": [True, False],
+        "encoder": [True, False],
+        "decoder": [True, False],
+        "encoder_threads": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "assembly": True,
+        "encoder": True,
+        "decoder": True,
+        "encoder_threads": None,
     }
     implements = ["auto_shared_fpic"]
 
@@ -36,9 +46,23 @@ class OpenH264Conan(ConanFile):
     def _is_clang_cl(self):
         return self.settings.os == 'Windows' and self.settings.compiler == 'clang'
 
+    def config_options(self):
+        if str(self.settings.arch) not in ["x86", "x86_64"] and not str(self.settings.arch).startswith(("armv7", "armv8")):
+            del self.options.assembly
+
+    def configure(self):
+        if not self.options.encoder:
+            del self.options.encoder_threads
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
+    def validate(self):
+        if not self.options.encoder and not self.options.decoder:
+            raise ConanInvalidConfiguration("At least one of encoder or decoder must be enabled")
+        if self._with_encoder_threads and not str(self.options.encoder_threads).isdigit():
+            raise ConanInvalidConfiguration("encoder_threads must be a number of threads, 0 meaning one per CPU core")
+
     def build_requirements(self):
         self.tool_requires("meson/[>=1.4.1 <2]")
         if not self.conf.get("tools.gnu:pkg_config", default=False, check_type=str):
@@ -60,7 +84,53 @@ class OpenH264Conan(ConanFile):
         tc.project_options["tests"] = "disabled"
         tc.generate()
 
+    @property
+    def _with_encoder_threads(self):
+        # "0" is a valid value, which is falsy as an option
+        return self.options.encoder and self.options.encoder_threads.value is not None
+
+    def _patch_sources(self):
+        meson_build = os.path.join(self.source_folder, "meson.build")
+        content = load(self, meson_build)
+        if not self.options.get_safe("assembly", True):
+            # Sources are still assembled, but without these defines the C code never dispatches to them
+            content, count = re.subn(r"'-D(?:X86_ASM|X86_32_ASM|HAVE_AVX2|HAVE_NEON|HAVE_NEON_ARM64)',?\s*", "", content)
+            if not count:
+                raise ConanException("SIMD defines not found in meson.build")
+        # libopenh264 is made of the objects of the static sub-libraries, processing only serves the encoder
+        removed = []
+        if not self.options.encoder:
+            removed.extend(["encoder", "processing"])
+        if not self.options.decoder:
+            removed.append("decoder")
+        for lib in removed:
+            content, count = re.subn(rf"\s*lib{lib}\.extract_all_objects\(\),?", "", content)
+            if not count:
+                raise ConanException(f"lib{lib} objects not found in meson.build")
+        save(self, meson_build, content)
+
+        removed_exports = []
+        if not self.options.encoder:
+            removed_exports.extend(["WelsCreateSVCEncoder", "WelsDestroySVCEncoder", "WelsGetCodecVersion", "WelsGetCodecVersionEx"])
+        if not self.options.decoder:
+            removed_exports.extend(["WelsCreateDecoder", "WelsDestroyDecoder", "WelsGetDecoderCapability"])
+        def_file = os.path.join(self.source_folder, "openh264.def")
+        if removed_exports and os.path.isfile(def_file):
+            content = load(self, def_file)
+            content = re.sub(rf"^\s*(?:{'|'.join(removed_exports)})\b.*\n", "", content, flags=re.MULTILINE)
+            save(self, def_file, content)
+
+        if self._with_encoder_threads:
+            # 0: one thread per core, 1: single threaded (upstream default), N: N threads
+            param_svc = os.path.join(self.source_folder, "codec", "encoder", "core", "inc", "param_svc.h")
+            content, count = re.subn(r"(iMultipleThreadIdc\s*=\s*)\d+\s*;", rf"\g<1>{self.options.encoder_threads};",
+                                     load(self, param_svc))
+            if not count:
+                raise ConanException("iMultipleThreadIdc default not found in param_svc.h")
+            save(self, param_svc, content)
+
     def build(self):
+        self._patch_sources()
         meson = Meson(self)
         meson.configure()
         meson.build()
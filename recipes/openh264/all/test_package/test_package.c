@@ -3,7 +3,16 @@
 
 int main()
 {
+#ifdef OPENH264_WITH_ENCODER
     OpenH264Version version = WelsGetCodecVersion();
     printf("OpenH264 version: %d.%d.%d\n", version.uMajor, version.uMinor, version.uRevision);
+#else
+    ISVCDecoder *decoder = NULL;
+    if (WelsCreateDecoder(&decoder) != 0 || decoder == NULL) {
+        return 1;
+    }
+    WelsDestroyDecoder(decoder);
+    printf("OpenH264 decoder created\n");
+#endif
     return 0;
 }
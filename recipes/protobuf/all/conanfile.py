@@ -29,6 +29,7 @@ class ProtobufConan(ConanFile):
         "lite": [True, False],
         "upb": [True, False],
         "debug_suffix": [True, False],
+        "upb_only": [True, False],
     }
     default_options = {
         "shared": False,
@@ -38,6 +39,11 @@ class ProtobufConan(ConanFile):
         "lite": False,
         "upb": False,
         "debug_suffix": True,
+        "upb_only": False,
+    }
+    options_description = {
+        "upb_only": "Only package the upb runtime (and the protoc/upb code generators) for C consumers, "
+                    "libprotobuf and libprotoc are not packaged. Requires upb=True and a static build",
     }
 
     short_paths = True
@@ -65,6 +71,7 @@ class ProtobufConan(ConanFile):
 
         if Version(self.version) >= "6.32.1":
             del self.options.upb
+            del self.options.upb_only
 
     def configure(self):
         if self.options.shared:
@@ -72,6 +79,7 @@ class ProtobufConan(ConanFile):
 
         if self._protobuf_release < "27.0":
             self.options.rm_safe("upb")
+            self.options.rm_safe("upb_only")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -95,6 +103,13 @@ class ProtobufConan(ConanFile):
             raise ConanInvalidConfiguration("When building protobuf as a shared library on Windows, "
                                             "abseil needs to be a shared library too")
 
+        if self.options.get_safe("upb_only"):
+            if not self.options.upb:
+                raise ConanInvalidConfiguration(f"-o {self.ref}:upb_only=True requires -o {self.ref}:upb=True")
+            if self.options.shared:
+                raise ConanInvalidConfiguration(f"-o {self.ref}:upb_only=True requires a static build, "
+                                                "protoc has to embed libprotobuf and libprotoc")
+
         min_cppstd = 17 if self._protobuf_release >= "30.1" else 14
         check_min_cppstd(self, min_cppstd)
 
@@ -185,10 +200,16 @@ class ProtobufConan(ConanFile):
         rm(self, "protobuf-targets*.cmake", folder=cmake_config_folder)
         copy(self, "protobuf-conan-protoc-target.cmake", src=self.source_folder, dst=cmake_config_folder)
 
-        if not self.options.lite:
+        if not self.options.lite or self.options.get_safe("upb_only"):
             rm(self, "libprotobuf-lite*", os.path.join(self.package_folder, "lib"))
             rm(self, "libprotobuf-lite*", os.path.join(self.package_folder, "bin"))
 
+        if self.options.get_safe("upb_only"):
+            # Already linked into protoc and the upb generators
+            for lib in ["protobuf", "protoc"]:
+                rm(self, f"lib{lib}.*", os.path.join(self.package_folder, "lib"))
+                rm(self, f"lib{lib}d.*", os.path.join(self.package_folder, "lib"))
+
     def package_info(self):
         self.cpp_info.set_property("cmake_find_mode", "both")
         self.cpp_info.set_property("cmake_module_file_name", "Protobuf")
@@ -229,6 +250,9 @@ class ProtobufConan(ConanFile):
             self.cpp_info.components["upb"].libs = [lib_prefix + "upb" + lib_suffix]
             self.cpp_info.components["upb"].requires = ["utf8_range"]
 
+        if self.options.get_safe("upb_only"):
+            return
+
         # libprotobuf
         self.cpp_info.components["libprotobuf"].set_property("cmake_target_name", "protobuf::libprotobuf")
         self.cpp_info.components["libprotobuf"].set_property("pkg_config_name", "protobuf")
@@ -0,0 +1,83 @@
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <string>
+#include <vector>
+
+#include <google/protobuf/arena.h>
+
+#include "addressbook.pb.h"
+
+// Corpus of serialized address books of various sizes
+static std::vector<std::string> make_corpus(std::size_t count) {
+	std::vector<std::string> corpus;
+	corpus.reserve(count);
+	for (std::size_t i = 0; i < count; ++i) {
+		tutorial::AddressBook book;
+		const int people = 1 + static_cast<int>(i % 16);
+		for (int p = 0; p < people; ++p) {
+			tutorial::Person* person = book.add_people();
+			person->set_name("Person " + std::to_string(i) + "-" + std::to_string(p));
+			person->set_id(static_cast<int>(i * 16 + p));
+			person->set_email("person" + std::to_string(p) + "@example.com");
+			for (int n = 0; n < p % 4; ++n) {
+				tutorial::Person::PhoneNumber* phone = person->add_phones();
+				phone->set_number("+1-555-" + std::to_string(1000 + n));
+				phone->set_type(static_cast<tutorial::Person::PhoneType>(n % 3));
+			}
+			person->mutable_last_updated()->set_seconds(static_cast<long long>(1700000000 + i));
+		}
+		corpus.push_back(book.SerializeAsString());
+	}
+	return corpus;
+}
+
+template <typename F>
+static double ns_per_message(const std::vector<std::string>& corpus, int rounds, F&& f) {
+	const auto start = std::chrono::steady_clock::now();
+	for (int r = 0; r < rounds; ++r) {
+		for (const std::string& data : corpus) {
+			if (!f(data)) {
+				std::fprintf(stderr, "(de)serialization failure\n");
+				std::exit(EXIT_FAILURE);
+			}
+		}
+	}
+	const auto elapsed = std::chrono::duration<double, std::nano>(std::chrono::steady_clock::now() - start);
+	return elapsed.count() / (static_cast<double>(corpus.size()) * rounds);
+}
+
+int main() {
+	GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+	const std::vector<std::string> corpus = make_corpus(10000);
+	const int rounds = 20;
+	std::string output;
+
+	const double heap_parse = ns_per_message(corpus, rounds, [](const std::string& data) {
+		tutorial::AddressBook book;
+		return book.ParseFromString(data);
+	});
+	const double arena_parse = ns_per_message(corpus, rounds, [](const std::string& data) {
+		google::protobuf::Arena arena;
+		auto* book = google::protobuf::Arena::Create<tutorial::AddressBook>(&arena);
+		return book->ParseFromString(data);
+	});
+	const double heap_roundtrip = ns_per_message(corpus, rounds, [&output](const std::string& data) {
+		tutorial::AddressBook book;
+		return book.ParseFromString(data) && book.SerializeToString(&output);
+	});
+	const double arena_roundtrip = ns_per_message(corpus, rounds, [&output](const std::string& data) {
+		google::protobuf::Arena arena;
+		auto* book = google::protobuf::Arena::Create<tutorial::AddressBook>(&arena);
+		return book->ParseFromString(data) && book->SerializeToString(&output);
+	});
+
+	std::printf("%zu messages x %d rounds\n", corpus.size(), rounds);
+	std::printf("%-22s %12s %12s\n", "", "heap ns/msg", "arena ns/msg");
+	std::printf("%-22s %12.1f %12.1f\n", "parse", heap_parse, arena_parse);
+	std::printf("%-22s %12.1f %12.1f\n", "parse + serialize", heap_roundtrip, arena_roundtrip);
+
+	google::protobuf::ShutdownProtobufLibrary();
+	return EXIT_SUCCESS;
+}
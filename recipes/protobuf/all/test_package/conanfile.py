@@ -10,6 +10,13 @@ class TestPackageConan(ConanFile):
     generators = "CMakeDeps", "VirtualBuildEnv", "VirtualRunEnv"
     test_type = "explicit"
 
+    @property
+    def _with_benchmark(self):
+        # Opt-in: conan create ... -c user.protobuf:benchmark=True
+        protobuf_options = self.dependencies[self.tested_reference_str].options
+        return (can_run(self) and not protobuf_options.lite and not protobuf_options.get_safe("upb_only")
+                and self.conf.get("user.protobuf:benchmark", default=False, check_type=bool))
+
     def layout(self):
         cmake_layout(self)
 
@@ -19,7 +26,10 @@ class TestPackageConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.cache_variables["protobuf_LITE"] = self.dependencies[self.tested_reference_str].options.lite
+        protobuf_options = self.dependencies[self.tested_reference_str].options
+        tc.cache_variables["protobuf_LITE"] = protobuf_options.lite
+        tc.cache_variables["protobuf_UPB_ONLY"] = bool(protobuf_options.get_safe("upb_only"))
+        tc.cache_variables["PROTOBUF_BENCHMARK"] = self._with_benchmark
         tc.generate()
 
     def build(self):
@@ -37,3 +47,7 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+
+            if self._with_benchmark:
+                bin_path = os.path.join(self.cpp.build.bindirs[0], "benchmark")
+                self.run(bin_path, env="conanrun")
@@ -1,7 +1,9 @@
 #include <cstdlib>
 #include <iostream>
 
-#if !defined(CONANTEST_PROTOBUF_LITE)
+#if defined(CONANTEST_PROTOBUF_UPB_ONLY)
+#include <upb/mem/arena.h>
+#elif !defined(CONANTEST_PROTOBUF_LITE)
 #include <google/protobuf/timestamp.pb.h>
 #include <google/protobuf/util/time_util.h>
 #else
@@ -11,7 +13,12 @@
 int main()
 {
 
-#if !defined(CONANTEST_PROTOBUF_LITE)
+#if defined(CONANTEST_PROTOBUF_UPB_ONLY)
+	upb_Arena* arena = upb_Arena_New();
+	void* buffer = upb_Arena_Malloc(arena, 64);
+	std::cout << "upb arena allocation: " << (buffer != nullptr ? "ok" : "failed") << "\n";
+	upb_Arena_Free(arena);
+#elif !defined(CONANTEST_PROTOBUF_LITE)
 	google::protobuf::Timestamp ts;
 	google::protobuf::util::TimeUtil::FromString("1972-01-01T10:00:20.021Z", &ts);
 	const auto nanoseconds = ts.nanos();
@@ -30,7 +30,12 @@ class RocksDBConan(ConanFile):
         "with_zstd": [True, False],
         "with_folly": [True, False],
         "with_jemalloc": [True, False],
-        "enable_sse": [False, "sse42", "avx2"],
+        "with_numa": [True, False],
+        "with_liburing": [True, False],
+        "with_tbb": [True, False],
+        "with_benchmark_tools": [True, False],
+        "isa_level": ["baseline", "native", "x86-64-v2", "x86-64-v3", "x86-64-v4"],
+        "enable_sse": [False, "sse42", "avx2", "deprecated"],
         "use_rtti": [True, False],
     }
     default_options = {
@@ -43,10 +48,24 @@ class RocksDBConan(ConanFile):
         "with_gflags": False,
         "with_jemalloc": False,
         "with_folly": False,
-        "enable_sse": False,
+        "with_numa": False,
+        "with_liburing": False,
+        "with_tbb": False,
+        "with_benchmark_tools": False,
+        "isa_level": "baseline",
+        "enable_sse": "deprecated",
         "use_rtti": False,
     }
-    
+    options_description = {
+        "with_numa": "Use libnuma for NUMA aware allocation policies",
+        "with_liburing": "Use io_uring for MultiGet and async prefetch reads",
+        "with_tbb": "Use TBB concurrent containers",
+        "with_benchmark_tools": "Build and package db_bench, requires with_gflags",
+        "isa_level": "Instruction set the library is built for (rocksdb PORTABLE): baseline of the architecture, "
+                     "the CPU of the build machine, or an x86-64 microarchitecture level (x86-64-v2 is the baseline with msvc)",
+        "enable_sse": "Deprecated, use 'isa_level' instead",
+    }
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -55,10 +74,32 @@ class RocksDBConan(ConanFile):
             del self.options.fPIC
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
+        if self.settings.os != "Linux":
+            del self.options.with_numa
+            del self.options.with_liburing
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        # Deprecated options
+        if self.options.enable_sse != "deprecated":
+            self.output.warning(f"The '{self.ref}/*:enable_sse' option is deprecated. Use '{self.ref}/*:isa_level' instead.")
+
+    @property
+    def _isa_level(self):
+        # The deprecated 'enable_sse' option takes precedence when set, both of its values
+        # used to build for haswell
+        if self.options.enable_sse != "deprecated":
+            return "x86-64-v3" if self.options.enable_sse else "baseline"
+        return str(self.options.isa_level)
+
+    def package_id(self):
+        if self.info.options.enable_sse != "deprecated":
+            self.info.options.isa_level = "x86-64-v3" if self.info.options.enable_sse else "baseline"
+        del self.info.options.enable_sse
+        if self.info.settings.compiler == "msvc" and self.info.options.isa_level == "x86-64-v2":
+            # Same binary as the baseline, see _portable
+            self.info.options.isa_level = "baseline"
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -78,6 +119,12 @@ class RocksDBConan(ConanFile):
             self.requires("jemalloc/5.3.0")
         if self.options.with_folly:
             self.requires("folly/2024.08.12.00")
+        if self.options.get_safe("with_numa"):
+            self.requires("libnuma/2.0.19")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/[>=2.4 <3]")
+        if self.options.with_tbb:
+            self.requires("onetbb/[>=2021 <2024]")
 
     def validate(self):
         check_min_cppstd(self, 20)
@@ -89,6 +136,13 @@ class RocksDBConan(ConanFile):
             # https://github.com/facebook/rocksdb/blob/v10.5.1/CMakeLists.txt#L603
             raise ConanInvalidConfiguration(f"{self.ref} does not support a shared build with folly")
 
+        if self._isa_level.startswith("x86-64") and self.settings.arch != "x86_64":
+            raise ConanInvalidConfiguration(f"-o {self.ref}:isa_level={self._isa_level} requires an x86_64 target")
+
+        if self.options.with_benchmark_tools and not self.options.with_gflags:
+            # db_bench is only a stub printing an error without gflags
+            raise ConanInvalidConfiguration(f"-o {self.ref}:with_benchmark_tools=True requires -o {self.ref}:with_gflags=True")
+
     def _patch_sources(self):
         # INFO: Avoid enforcing all linkers to use copy-dt-needed-entries
         # https://github.com/facebook/rocksdb/issues/13895
@@ -106,7 +160,7 @@ class RocksDBConan(ConanFile):
         tc.variables["WITH_TESTS"] = False
         tc.variables["WITH_TOOLS"] = False
         tc.variables["WITH_CORE_TOOLS"] = False
-        tc.variables["WITH_BENCHMARK_TOOLS"] = False
+        tc.variables["WITH_BENCHMARK_TOOLS"] = self.options.with_benchmark_tools
         tc.variables["USE_FOLLY"] = self.options.with_folly
         if is_msvc(self):
             tc.variables["WITH_MD_LIBRARY"] = not is_msvc_static_runtime(self)
@@ -119,12 +173,13 @@ class RocksDBConan(ConanFile):
         tc.variables["WITH_JEMALLOC"] = self.options.with_jemalloc
         tc.variables["ROCKSDB_BUILD_SHARED"] = self.options.shared
         tc.variables["USE_RTTI"] = self.options.use_rtti
-        if not bool(self.options.enable_sse):
-            tc.variables["PORTABLE"] = True
-        else:
-            tc.cache_variables["PORTABLE"] = "AVX2" if is_msvc(self) else "haswell"
-        # not available yet in CCI
-        tc.variables["WITH_NUMA"] = False
+        tc.cache_variables["PORTABLE"] = self._portable
+        if self._msvc_arch_flags:
+            tc.extra_cflags = self._msvc_arch_flags
+            tc.extra_cxxflags = self._msvc_arch_flags
+        tc.variables["WITH_NUMA"] = self.options.get_safe("with_numa", False)
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
+        tc.variables["WITH_TBB"] = self.options.with_tbb
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -135,8 +190,40 @@ class RocksDBConan(ConanFile):
             deps.set_property("zstd", "cmake_target_name", "zstd::zstd")
         if self.options.with_folly:
             deps.set_property("folly", "cmake_additional_variables_prefixes", ["FOLLY",])
+        if self.options.get_safe("with_numa"):
+            deps.set_property("libnuma", "cmake_file_name", "NUMA")
+            deps.set_property("libnuma", "cmake_target_name", "NUMA::NUMA")
+        if self.options.get_safe("with_liburing"):
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
+        if self.options.with_tbb:
+            # Only tbb itself, not the tbbmalloc_proxy malloc replacement
+            deps.set_property("onetbb::libtbb", "cmake_target_name", "TBB::TBB")
         deps.generate()
 
+    @property
+    def _portable(self):
+        # https://github.com/facebook/rocksdb/blob/v10.10.1/CMakeLists.txt: PORTABLE is either
+        # 0 (native), 1 (baseline) or the -march value, which is the /arch value with msvc
+        if self._isa_level == "native":
+            return "0"
+        if self._isa_level == "baseline":
+            return "1"
+        if is_msvc(self):
+            return {
+                # There is no /arch between the SSE2 default and AVX, which x86-64-v2 CPUs may lack
+                "x86-64-v2": "1",
+                "x86-64-v3": "AVX2",
+                # upstream tests PORTABLE with an unanchored "1|ON|YES|TRUE|Y" regex first, which
+                # "AVX512" matches, so /arch:AVX512 is passed with the baseline value instead
+                "x86-64-v4": "1",
+            }[self._isa_level]
+        return self._isa_level
+
+    @property
+    def _msvc_arch_flags(self):
+        return ["/arch:AVX512"] if is_msvc(self) and self._isa_level == "x86-64-v4" else []
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -155,6 +242,10 @@ class RocksDBConan(ConanFile):
         cmake.install()
         if self.options.shared:
             self._remove_static_libraries()
+        if self.options.with_benchmark_tools:
+            # Not installed by upstream
+            for program in ["db_bench", "db_bench.exe"]:
+                copy(self, program, src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
 
@@ -185,3 +276,9 @@ class RocksDBConan(ConanFile):
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
         if self.options.with_folly:
             self.cpp_info.components["librocksdb"].requires.append("folly::folly")
+        if self.options.get_safe("with_numa"):
+            self.cpp_info.components["librocksdb"].requires.append("libnuma::libnuma")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
+        if self.options.with_tbb:
+            self.cpp_info.components["librocksdb"].requires.append("onetbb::libtbb")
@@ -48,6 +48,15 @@ class Sqlite3Conan(ConanFile):
         "build_executable": [True, False],
         "enable_default_vfs": [True, False],
         "enable_dbpage_vtab": [True, False],
+        "default_mmap_size": [None, "ANY"],
+        "max_mmap_size": [None, "ANY"],
+        "default_page_size": [None, "512", "1024", "2048", "4096", "8192", "16384", "32768", "65536"],
+        "default_cache_size": [None, "ANY"],
+        "default_wal_synchronous": [None, "off", "normal", "full", "extra"],
+        "default_memstatus": [True, False],
+        "like_doesnt_match_blobs": [True, False],
+        "max_expr_depth": [None, "ANY"],
+        "omit_shared_cache": [True, False],
     }
     default_options = {
         "shared": False,
@@ -80,6 +89,27 @@ class Sqlite3Conan(ConanFile):
         "build_executable": True,
         "enable_default_vfs": True,
         "enable_dbpage_vtab": False,
+        # Performance related defaults, see "Recommended Compile-time Options" in https://www.sqlite.org/compile.html
+        "default_mmap_size": None,        # Uses default value from source
+        "max_mmap_size": None,            # Uses default value from source
+        "default_page_size": None,        # Uses default value from source
+        "default_cache_size": None,       # Uses default value from source
+        "default_wal_synchronous": None,  # Same as the synchronous setting of rollback journals
+        "default_memstatus": True,
+        "like_doesnt_match_blobs": False,
+        "max_expr_depth": None,           # Uses default value from source
+        "omit_shared_cache": False,
+    }
+    options_description = {
+        "default_mmap_size": "SQLITE_DEFAULT_MMAP_SIZE: default PRAGMA mmap_size, in bytes",
+        "max_mmap_size": "SQLITE_MAX_MMAP_SIZE: upper bound of PRAGMA mmap_size, in bytes",
+        "default_page_size": "SQLITE_DEFAULT_PAGE_SIZE: page size of new databases, in bytes",
+        "default_cache_size": "SQLITE_DEFAULT_CACHE_SIZE: default PRAGMA cache_size, in pages if positive, in KiB if negative",
+        "default_wal_synchronous": "SQLITE_DEFAULT_WAL_SYNCHRONOUS: default PRAGMA synchronous of databases in WAL mode",
+        "default_memstatus": "SQLITE_DEFAULT_MEMSTATUS: memory usage tracking, which serializes malloc() behind a mutex",
+        "like_doesnt_match_blobs": "SQLITE_LIKE_DOESNT_MATCH_BLOBS: LIKE and GLOB always return false for BLOB operands",
+        "max_expr_depth": "SQLITE_MAX_EXPR_DEPTH: maximum depth of expression trees, 0 disables the depth check",
+        "omit_shared_cache": "SQLITE_OMIT_SHARED_CACHE: remove shared cache support, which speeds up critical paths",
     }
 
     exports_sources = "CMakeLists.txt"
@@ -109,6 +139,13 @@ class Sqlite3Conan(ConanFile):
             if self.options.omit_load_extension:
                 raise ConanInvalidConfiguration("build_executable=True requires omit_load_extension=True")
 
+        for option in ["default_mmap_size", "max_mmap_size", "max_expr_depth"]:
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"{option} must be a non-negative integer")
+        if self.options.default_cache_size and not str(self.options.default_cache_size).lstrip("-").isdigit():
+            raise ConanInvalidConfiguration("default_cache_size must be an integer")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -153,6 +190,21 @@ class Sqlite3Conan(ConanFile):
             tc.variables["MAX_BLOB_SIZE"] = self.options.max_blob_size
         tc.variables["DISABLE_DEFAULT_VFS"] = not self.options.enable_default_vfs
         tc.variables["ENABLE_DBPAGE_VTAB"] = self.options.enable_dbpage_vtab
+        if self.options.default_mmap_size.value is not None:
+            tc.variables["DEFAULT_MMAP_SIZE"] = str(self.options.default_mmap_size)
+        if self.options.max_mmap_size.value is not None:
+            tc.variables["MAX_MMAP_SIZE"] = str(self.options.max_mmap_size)
+        if self.options.default_page_size:
+            tc.variables["DEFAULT_PAGE_SIZE"] = self.options.default_page_size
+        if self.options.default_cache_size:
+            tc.variables["DEFAULT_CACHE_SIZE"] = self.options.default_cache_size
+        if self.options.default_wal_synchronous:
+            tc.variables["DEFAULT_WAL_SYNCHRONOUS"] = ["off", "normal", "full", "extra"].index(str(self.options.default_wal_synchronous))
+        tc.variables["DEFAULT_MEMSTATUS"] = self.options.default_memstatus
+        tc.variables["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
+        if self.options.max_expr_depth.value is not None:
+            tc.variables["MAX_EXPR_DEPTH"] = str(self.options.max_expr_depth)
+        tc.variables["OMIT_SHARED_CACHE"] = self.options.omit_shared_cache
         tc.generate()
 
     def build(self):
@@ -0,0 +1,73 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+#include <sqlite3.h>
+
+static double elapsed_seconds(const struct timespec* start, const struct timespec* end) {
+    return (double)(end->tv_sec - start->tv_sec) + (double)(end->tv_nsec - start->tv_nsec) / 1e9;
+}
+
+static int check(sqlite3* db, int rc, const char* what) {
+    if (rc != SQLITE_OK && rc != SQLITE_DONE && rc != SQLITE_ROW) {
+        fprintf(stderr, "%s: %s\n", what, sqlite3_errmsg(db));
+        exit(EXIT_FAILURE);
+    }
+    return rc;
+}
+
+int main(void) {
+    const char* path = "benchmark.db";
+    const int nb_rows = 200000;
+    const int nb_selects = 200000;
+    sqlite3* db = NULL;
+    sqlite3_stmt* stmt = NULL;
+    struct timespec start, end;
+    char payload[64];
+
+    remove(path);
+    check(db, sqlite3_open(path, &db), "open");
+    check(db, sqlite3_exec(db, "PRAGMA journal_mode=WAL", NULL, NULL, NULL), "journal_mode");
+    check(db, sqlite3_exec(db, "CREATE TABLE kv (k INTEGER PRIMARY KEY, v TEXT NOT NULL)", NULL, NULL, NULL), "create");
+
+    /* Inserts in a single transaction, with a prepared statement */
+    timespec_get(&start, TIME_UTC);
+    check(db, sqlite3_exec(db, "BEGIN", NULL, NULL, NULL), "begin");
+    check(db, sqlite3_prepare_v2(db, "INSERT INTO kv (k, v) VALUES (?, ?)", -1, &stmt, NULL), "prepare insert");
+    for (int i = 0; i < nb_rows; ++i) {
+        snprintf(payload, sizeof(payload), "value-%d-%08x", i, (unsigned int)i * 2654435761u);
+        sqlite3_bind_int(stmt, 1, i);
+        sqlite3_bind_text(stmt, 2, payload, -1, SQLITE_STATIC);
+        check(db, sqlite3_step(stmt), "insert");
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    check(db, sqlite3_exec(db, "COMMIT", NULL, NULL, NULL), "commit");
+    timespec_get(&end, TIME_UTC);
+    const double insert_seconds = elapsed_seconds(&start, &end);
+
+    /* Point selects by primary key */
+    long long total_length = 0;
+    unsigned int key = 1;
+    timespec_get(&start, TIME_UTC);
+    check(db, sqlite3_prepare_v2(db, "SELECT v FROM kv WHERE k = ?", -1, &stmt, NULL), "prepare select");
+    for (int i = 0; i < nb_selects; ++i) {
+        key = key * 1103515245u + 12345u;
+        sqlite3_bind_int(stmt, 1, (int)((key >> 8) % (unsigned int)nb_rows));
+        if (check(db, sqlite3_step(stmt), "select") == SQLITE_ROW) {
+            total_length += sqlite3_column_bytes(stmt, 0);
+        }
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    timespec_get(&end, TIME_UTC);
+    const double select_seconds = elapsed_seconds(&start, &end);
+
+    sqlite3_close(db);
+    remove(path);
+
+    printf("SQLite %s\n", sqlite3_libversion());
+    printf("%-8s %10s %14s\n", "", "rows", "rows/s");
+    printf("%-8s %10d %14.0f\n", "insert", nb_rows, nb_rows / (insert_seconds > 0 ? insert_seconds : 1e-9));
+    printf("%-8s %10d %14.0f\n", "select", nb_selects, nb_selects / (select_seconds > 0 ? select_seconds : 1e-9));
+    return total_length > 0 ? EXIT_SUCCESS : EXIT_FAILURE;
+}
@@ -1,20 +1,30 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
+    @property
+    def _with_benchmark(self):
+        # Opt-in: conan create ... -c user.sqlite3:benchmark=True
+        return self.conf.get("user.sqlite3:benchmark", default=False, check_type=bool)
+
     def layout(self):
         cmake_layout(self)
 
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.variables["SQLITE3_BENCHMARK"] = self._with_benchmark
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -24,3 +34,7 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+
+            if self._with_benchmark:
+                bin_path = os.path.join(self.cpp.build.bindirs[0], "benchmark")
+                self.run(bin_path, env="conanrun")
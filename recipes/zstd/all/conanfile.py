@@ -1,9 +1,10 @@
 from conan import ConanFile
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rmdir, rm
+from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rmdir, rm, save
 from conan.tools.scm import Version
 import glob
 import os
+import textwrap
 
 required_conan_version = ">=2.1"
 
@@ -22,12 +23,23 @@ class ZstdConan(ConanFile):
         "fPIC": [True, False],
         "threading": [True, False],
         "build_programs": [True, False],
+        "legacy_support": [0, 1, 2, 3, 4, 5, 6, 7],
+        "disable_asm": [True, False],
+        "build_contrib": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threading": True,
         "build_programs": True,
+        "legacy_support": 5,
+        "disable_asm": False,
+        "build_contrib": False,
+    }
+    options_description = {
+        "legacy_support": "ZSTD_LEGACY_SUPPORT level: decode legacy formats starting from v0.N, 0 disables legacy decoders",
+        "disable_asm": "Disable the x86-64 BMI2 assembly Huffman decoder (ZSTD_DISABLE_ASM)",
+        "build_contrib": "Build the seekable format library and the pzstd parallel (de)compression program",
     }
 
     def export_sources(self):
@@ -40,8 +52,10 @@ class ZstdConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
-        self.settings.rm_safe("compiler.cppstd")
-        self.settings.rm_safe("compiler.libcxx")
+        if not self.options.build_contrib:
+            # pzstd is the only C++ code
+            self.settings.rm_safe("compiler.cppstd")
+            self.settings.rm_safe("compiler.libcxx")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -52,9 +66,15 @@ class ZstdConan(ConanFile):
     def generate(self):
         tc = CMakeToolchain(self)
         tc.variables["ZSTD_BUILD_PROGRAMS"] = self.options.build_programs
-        tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
+        tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs or self.options.build_contrib
         tc.variables["ZSTD_BUILD_SHARED"] = self.options.shared
         tc.variables["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        tc.variables["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_support != 0
+        if self.options.legacy_support != 0:
+            tc.cache_variables["ZSTD_LEGACY_LEVEL"] = str(self.options.legacy_support)
+        if self.options.disable_asm:
+            tc.preprocessor_definitions["ZSTD_DISABLE_ASM"] = "1"
+        tc.variables["ZSTD_BUILD_CONTRIB"] = self.options.build_contrib
         if Version(self.version) < "1.5.6":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
@@ -64,6 +84,24 @@ class ZstdConan(ConanFile):
         # Don't force PIC
         replace_in_file(self, os.path.join(self.source_folder, "build", "cmake", "lib", "CMakeLists.txt"),
                               "POSITION_INDEPENDENT_CODE On", "")
+        if self.options.build_contrib:
+            # The seekable format is only built by its Makefile upstream
+            zstd_target = "libzstd_shared" if self.options.shared else "libzstd_static"
+            save(self, os.path.join(self.source_folder, "build", "cmake", "CMakeLists.txt"), textwrap.dedent(f"""\
+
+                set(SEEKABLE_DIR "${{ZSTD_SOURCE_DIR}}/contrib/seekable_format")
+                add_library(zstd_seekable "${{SEEKABLE_DIR}}/zstdseek_compress.c" "${{SEEKABLE_DIR}}/zstdseek_decompress.c")
+                target_include_directories(zstd_seekable PRIVATE "${{LIBRARY_DIR}}/common" PUBLIC "${{SEEKABLE_DIR}}")
+                # Private xxhash symbols are not exported by libzstd
+                target_compile_definitions(zstd_seekable PRIVATE XXH_INLINE_ALL)
+                target_link_libraries(zstd_seekable PUBLIC {zstd_target})
+                set_target_properties(zstd_seekable PROPERTIES WINDOWS_EXPORT_ALL_SYMBOLS ON)
+                install(TARGETS zstd_seekable
+                        RUNTIME DESTINATION "${{CMAKE_INSTALL_BINDIR}}"
+                        ARCHIVE DESTINATION "${{CMAKE_INSTALL_LIBDIR}}"
+                        LIBRARY DESTINATION "${{CMAKE_INSTALL_LIBDIR}}")
+                install(FILES "${{SEEKABLE_DIR}}/zstd_seekable.h" DESTINATION "${{CMAKE_INSTALL_INCLUDEDIR}}")
+            """), append=True)
 
     def build(self):
         self._patch_sources()
@@ -79,7 +117,7 @@ class ZstdConan(ConanFile):
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
 
-        if self.options.shared and self.options.build_programs:
+        if self.options.shared and (self.options.build_programs or self.options.build_contrib):
             # If we build programs we have to build static libs (see logic in generate()),
             # but if shared is True, we only want shared lib in package folder.
             rm(self, "*_static.*", os.path.join(self.package_folder, "lib"))
@@ -93,10 +131,16 @@ class ZstdConan(ConanFile):
         self.cpp_info.set_property("cmake_target_name", f"zstd::{zstd_cmake}")
         self.cpp_info.set_property("pkg_config_name", "libzstd")
         self.cpp_info.set_property("cmake_target_aliases", ["zstd::libzstd"])
-        self.cpp_info.components["zstdlib"].libs = collect_libs(self)
+        # zstd_static with MSVC-like compilers (including clang-cl), the contrib library is its own component
+        self.cpp_info.components["zstdlib"].libs = [lib for lib in collect_libs(self) if lib != "zstd_seekable"]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["zstdlib"].system_libs.append("pthread")
 
+        if self.options.build_contrib:
+            self.cpp_info.components["zstd_seekable"].set_property("cmake_target_name", "zstd::zstd_seekable")
+            self.cpp_info.components["zstd_seekable"].libs = ["zstd_seekable"]
+            self.cpp_info.components["zstd_seekable"].requires = ["zstdlib"]
+
         # TODO: Remove after dropping Conan 1.x from ConanCenterIndex
         self.cpp_info.components["zstdlib"].set_property("cmake_target_name", f"zstd::{zstd_cmake}")
         self.cpp_info.components["zstdlib"].set_property("pkg_config_name", "libzstd")
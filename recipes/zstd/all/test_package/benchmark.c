@@ -0,0 +1,76 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include <zstd.h>
+
+/* Synthetic, moderately compressible corpus: repeated words with a bit of noise */
+static void fill_corpus(char* buffer, size_t size) {
+    static const char* words[] = {"conan", "center", "index", "zstd", "compression", "level",
+                                  "worker", "thread", "block", "frame", "dictionary", "entropy"};
+    const size_t nb_words = sizeof(words) / sizeof(words[0]);
+    unsigned int seed = 42;
+    size_t pos = 0;
+    while (pos < size) {
+        seed = seed * 1103515245u + 12345u;
+        const char* word = words[(seed >> 16) % nb_words];
+        size_t len = strlen(word);
+        if (pos + len + 1 > size) {
+            len = size - pos;
+        }
+        memcpy(buffer + pos, word, len);
+        pos += len;
+        if (pos < size) {
+            buffer[pos++] = (seed & 0x100) ? ' ' : (char)('a' + (seed >> 24) % 26);
+        }
+    }
+}
+
+static double elapsed_seconds(const struct timespec* start, const struct timespec* end) {
+    return (double)(end->tv_sec - start->tv_sec) + (double)(end->tv_nsec - start->tv_nsec) / 1e9;
+}
+
+int main(void) {
+    const size_t src_size = 32 * 1024 * 1024;
+    const int levels[] = {1, 3, 9, 19};
+    const int workers[] = {0, 2, 4, 8};
+    char* src = malloc(src_size);
+    const size_t dst_capacity = ZSTD_compressBound(src_size);
+    char* dst = malloc(dst_capacity);
+    ZSTD_CCtx* cctx = ZSTD_createCCtx();
+    if (src == NULL || dst == NULL || cctx == NULL) {
+        fprintf(stderr, "allocation failure\n");
+        return EXIT_FAILURE;
+    }
+    fill_corpus(src, src_size);
+
+    printf("zstd %s, corpus %zu MiB\n", ZSTD_versionString(), src_size >> 20);
+    printf("%6s %8s %10s %12s\n", "level", "workers", "ratio", "MiB/s");
+    for (size_t l = 0; l < sizeof(levels) / sizeof(levels[0]); ++l) {
+        for (size_t w = 0; w < sizeof(workers) / sizeof(workers[0]); ++w) {
+            ZSTD_CCtx_reset(cctx, ZSTD_reset_session_and_parameters);
+            ZSTD_CCtx_setParameter(cctx, ZSTD_c_compressionLevel, levels[l]);
+            if (ZSTD_isError(ZSTD_CCtx_setParameter(cctx, ZSTD_c_nbWorkers, workers[w]))) {
+                /* Library built without multithreading support */
+                continue;
+            }
+
+            struct timespec start, end;
+            timespec_get(&start, TIME_UTC);
+            const size_t csize = ZSTD_compress2(cctx, dst, dst_capacity, src, src_size);
+            timespec_get(&end, TIME_UTC);
+            if (ZSTD_isError(csize)) {
+                fprintf(stderr, "compression error: %s\n", ZSTD_getErrorName(csize));
+                return EXIT_FAILURE;
+            }
+            const double seconds = elapsed_seconds(&start, &end);
+            printf("%6d %8d %10.2f %12.1f\n", levels[l], workers[w], (double)src_size / (double)csize,
+                   (double)(src_size >> 20) / (seconds > 0 ? seconds : 1e-9));
+        }
+    }
+
+    ZSTD_freeCCtx(cctx);
+    free(dst);
+    free(src);
+    return EXIT_SUCCESS;
+}